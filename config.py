@@ -4,8 +4,8 @@ Configuration settings for PDF Compliance Scanner
 import os
 from pathlib import Path
 
-# Base directory
-BASE_DIR = Path(__file__).resolve().parent
+# Base directory (abspath avoids the realpath syscalls of Path.resolve)
+BASE_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
 
 # Upload settings
 UPLOAD_FOLDER = BASE_DIR / 'uploads'
@@ -23,6 +23,7 @@ VERAPDF_OUTPUT_FORMAT = 'json'
 # Processing settings
 PARALLEL_PROCESSES = 4  # Number of parallel PDF validations
 SCAN_TIMEOUT = 300  # Timeout in seconds for single PDF scan
+VERAPDF_BATCH_SIZE = 20  # PDFs validated per veraPDF run (one JVM startup per batch)
 
 # Java settings
 MIN_JAVA_VERSION = 8
@@ -35,14 +36,33 @@ LOG_FILE = LOGS_FOLDER / 'scanner.log'
 LOG_MAX_BYTES = 10 * 1024 * 1024  # 10MB
 LOG_BACKUP_COUNT = 5
 
+# Cache settings
+CACHE_FOLDER = BASE_DIR / 'cache'
+SCAN_CACHE_FILE = CACHE_FOLDER / 'scan_cache.json'
+ENABLE_SCAN_CACHE = True  # Skip re-validating PDFs whose content is unchanged
+SCAN_CACHE_MAX_ENTRIES = 2000  # Least recently used results beyond this are dropped
+ENV_CACHE_FILE = Path.home() / '.pdfscanner' / 'env.json'  # Last known veraPDF/Java setup
+
 # GUI settings
 WINDOW_TITLE = "PDF Compliance Scanner"
 WINDOW_WIDTH = 1200
 WINDOW_HEIGHT = 700
 THEME_MODE = "dark"  # "dark" or "light"
 COLOR_THEME = "blue"  # "blue", "green", "dark-blue"
+ENABLE_IDLE_PREFETCH = True  # Import report/annotation modules in background after startup
+
+_dirs_ready = False
+
 
-# Ensure directories exist
-UPLOAD_FOLDER.mkdir(parents=True, exist_ok=True)
-REPORTS_FOLDER.mkdir(parents=True, exist_ok=True)
-LOGS_FOLDER.mkdir(parents=True, exist_ok=True)
+def ensure_dirs():
+    """
+    Create the application's working directories.
+    Called once by the entry points instead of at import time, so that
+    importing config stays free of filesystem writes.
+    """
+    global _dirs_ready
+    if _dirs_ready:
+        return
+    for folder in (UPLOAD_FOLDER, REPORTS_FOLDER, LOGS_FOLDER, CACHE_FOLDER):
+        folder.mkdir(parents=True, exist_ok=True)
+    _dirs_ready = True
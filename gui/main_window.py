@@ -4,22 +4,83 @@ Main application window for PDF Compliance Scanner
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
 import threading
-from pathlib import Path
-from typing import List, Optional
+import queue
+import importlib
+from collections import deque
+import logging
+from typing import List, Optional, Set
 
 from utils.logger import setup_logger
-from services.pdf_scanner import PDFScanner, discover_pdfs
-from services.report_generator import generate_html_report, generate_excel_report
-from services.report_generator import generate_html_report, generate_excel_report
-from services.pdf_annotator import PDFAnnotator
-from gui.pdf_viewer_frame import PDFViewerFrame
-from models.scan_result import ScanJob
+from services.pdf_scanner import PDFScanner, PDFListingCache
+from services.scan_cache import ScanCache
+from services import env_cache
+from utils.verapdf_wrapper import set_verapdf_executable
+from gui.results_list_frame import ResultsListFrame
+from models.scan_result import ScanJob, PDFResult
 import config
 import webbrowser
 import os
+import subprocess
+import sys
+from os.path import basename
 
 logger = setup_logger(__name__)
 
+LOG_FILE_PATH = os.fspath(config.LOG_FILE)
+
+PROGRESS_FLUSH_MS = 50  # Progress widgets refresh at most every 50 ms (20 Hz)
+
+# Modules imported lazily on first use, warmed up after startup when idle
+IDLE_PREFETCH_DELAY_MS = 1500
+PREFETCH_MODULES = (
+    "utils.pdf_utils",
+    "services.report_generator",
+    "services.pdf_annotator",
+    "gui.pdf_viewer_frame",
+)
+
+
+class DaemonWorkerPool:
+    """
+    Fixed set of daemon threads fed from one queue.
+    Unlike ThreadPoolExecutor, whose workers are joined at interpreter exit,
+    closing the window never waits on a job that is still running.
+    """
+    
+    def __init__(self, size: int, name: str):
+        self._jobs: "queue.Queue" = queue.Queue()
+        self._closed = threading.Event()
+        self._size = size
+        for i in range(size):
+            threading.Thread(target=self._run, name=f"{name}-{i}", daemon=True).start()
+    
+    def submit(self, fn, *args):
+        """Queue fn(*args) to run on a worker thread"""
+        if not self._closed.is_set():
+            self._jobs.put((fn, args))
+    
+    def shutdown(self):
+        """Stop taking jobs; queued jobs are dropped and idle workers exit"""
+        self._closed.set()
+        while True:
+            try:
+                self._jobs.get_nowait()
+            except queue.Empty:
+                break
+        for _ in range(self._size):
+            self._jobs.put(None)  # Wake idle workers so they see the closed flag
+    
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            if job is None or self._closed.is_set():
+                return
+            fn, args = job
+            try:
+                fn(*args)
+            except Exception as e:
+                logger.error(f"Background job failed: {e}", exc_info=True)
+
 
 class MainWindow(ctk.CTk):
     """Main application window"""
@@ -27,15 +88,33 @@ class MainWindow(ctk.CTk):
     def __init__(self):
         super().__init__()
         
+        config.ensure_dirs()
+        
         # Configure window
         self.title(config.WINDOW_TITLE)
         self.geometry(f"{config.WINDOW_WIDTH}x{config.WINDOW_HEIGHT}")
         
-        # Initialize services
-        self.scanner = PDFScanner()
-        self.annotator = PDFAnnotator()
+        # Initialize services from the last known environment (re-checked in background)
+        self._env = env_cache.load()
+        self.scanner = PDFScanner(cache=self._create_scan_cache())
+        self._scanning = False
+        self._cache_swap_pending = False  # veraPDF version changed during a scan
+        self._annotator = None  # Created on first "View Annotations"
+        self.pdf_viewer = None  # Created on first "Inspect In-App"
+        # Shared background workers for scans and annotation
+        self._workers = DaemonWorkerPool(2, "pdf-worker")
+        self._annotating: Set[str] = set()  # Files with an annotation run pending
+        self._log_exists = False
         self.current_job: Optional[ScanJob] = None
         self.selected_files: List[str] = []
+        self._pdf_listing_cache = PDFListingCache()
+        self._pending_progress = (0, 1, "")
+        self._progress_job = None  # after() id of the pending progress flush
+        self._stream_counts = {"compliant": 0, "non_compliant": 0, "error": 0}
+        self._stream_total = 0  # File count of the running scan, fixed when it starts
+        self._pending_results = deque()  # Streamed results waiting for the UI thread
+        self._results_flush_scheduled = False
+        self._last_status = ""
         
         # Configure grid
         self.grid_columnconfigure(0, weight=1)
@@ -46,7 +125,82 @@ class MainWindow(ctk.CTk):
         self._create_main_content()
         self._create_statusbar()
         
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+        if config.ENABLE_IDLE_PREFETCH:
+            self.after(IDLE_PREFETCH_DELAY_MS, self._idle_prefetch)
+        
         logger.info("Main window initialized")
+        
+        threading.Thread(target=self._revalidate_environment, daemon=True).start()
+    
+    def _idle_prefetch(self):
+        """Warm up heavy imports in background once the window is idle"""
+        def prefetch():
+            for module in PREFETCH_MODULES:
+                try:
+                    importlib.import_module(module)
+                except Exception as e:
+                    logger.debug(f"Prefetch of {module} failed: {e}")
+            logger.debug("Idle prefetch complete")
+        
+        threading.Thread(target=prefetch, daemon=True).start()
+    
+    def _on_close(self):
+        """Stop any running scan (and its veraPDF process) before closing"""
+        logger.info("Closing main window")
+        self.scanner.stop()
+        self._workers.shutdown()
+        self.destroy()
+    
+    def _create_scan_cache(self) -> Optional[ScanCache]:
+        """Create the scan cache for the current veraPDF version, if enabled"""
+        if not config.ENABLE_SCAN_CACHE:
+            return None
+        return ScanCache(verapdf_version=self._env.verapdf_version or "")
+    
+    def _revalidate_environment(self):
+        """Background thread: re-probe veraPDF and Java and refresh the environment cache"""
+        try:
+            env = env_cache.revalidate()
+        except Exception as e:
+            logger.error(f"Environment check failed: {e}", exc_info=True)
+            return
+        
+        if env != self._env:
+            self.after(0, self._on_environment_changed, env)
+    
+    def _on_environment_changed(self, env: env_cache.CachedEnvironment):
+        """Apply a changed veraPDF/Java environment on the UI thread"""
+        previous = self._env
+        self._env = env
+        logger.info(f"Environment changed: {previous} -> {env}")
+        
+        if env.verapdf_path:
+            set_verapdf_executable(env.verapdf_path)
+        
+        # Results from another veraPDF version are not reusable; a running scan
+        # keeps its cache and the swap happens once it finishes
+        if env.verapdf_version != previous.verapdf_version:
+            if self._scanning:
+                self._cache_swap_pending = True
+            else:
+                self.scanner.cache = self._create_scan_cache()
+        
+        if not env_cache.is_usable(env):
+            messagebox.showwarning(
+                "Environment Changed",
+                "veraPDF or Java is no longer available.\n\n"
+                "Scans will fail until the installation is restored. "
+                "Restart the application for details."
+            )
+    
+    def _get_annotator(self):
+        """Return the PDF annotator, importing and creating it on first use"""
+        if self._annotator is None:
+            from services.pdf_annotator import PDFAnnotator
+            self._annotator = PDFAnnotator()
+        return self._annotator
     
     def _create_header(self):
         """Create header with title and controls"""
@@ -123,16 +277,16 @@ class MainWindow(ctk.CTk):
         )
         btn_files.pack(side="left", padx=5)
         
-        btn_folder = ctk.CTkButton(
+        self.btn_folder = ctk.CTkButton(
             btn_frame,
             text="📂 Browse Folder",
             command=self._browse_folder,
             width=150,
             height=40
         )
-        btn_folder.pack(side="left", padx=5)
+        self.btn_folder.pack(side="left", padx=5)
         
-        btn_scan = ctk.CTkButton(
+        self.btn_scan = ctk.CTkButton(
             btn_frame,
             text="🔍 Start Scan",
             command=self._start_scan,
@@ -141,7 +295,21 @@ class MainWindow(ctk.CTk):
             fg_color="green",
             hover_color="darkgreen"
         )
-        btn_scan.pack(side="left", padx=5)
+        self.btn_scan.pack(side="left", padx=5)
+        
+        # Concurrent veraPDF runs
+        workers_label = ctk.CTkLabel(btn_frame, text="Workers:", font=("Segoe UI", 12))
+        workers_label.pack(side="left", padx=(15, 5))
+        
+        max_workers = max(config.PARALLEL_PROCESSES, os.cpu_count() or 1)
+        self.workers_menu = ctk.CTkOptionMenu(
+            btn_frame,
+            values=[str(n) for n in range(1, max_workers + 1)],
+            width=70,
+            height=40
+        )
+        self.workers_menu.set(str(config.PARALLEL_PROCESSES))
+        self.workers_menu.pack(side="left", padx=5)
         
         # Selected files label
         self.files_label = ctk.CTkLabel(
@@ -168,7 +336,7 @@ class MainWindow(ctk.CTk):
         results_frame = ctk.CTkFrame(self.main_frame)
         results_frame.grid(row=2, column=0, sticky="nsew", padx=10, pady=10)
         results_frame.grid_columnconfigure(0, weight=1)
-        results_frame.grid_rowconfigure(1, weight=1)
+        results_frame.grid_rowconfigure(2, weight=1)
         
         # Title and export buttons
         header_frame = ctk.CTkFrame(results_frame, fg_color="transparent")
@@ -205,12 +373,26 @@ class MainWindow(ctk.CTk):
         
         # NOTE: View Errors and Inspect buttons are now per-result in the scrollable list below
         
-        # Results scrollable area
-        self.results_list = ctk.CTkScrollableFrame(
+        # Summary Header (shown once a scan completes)
+        self.summary_frame = ctk.CTkFrame(results_frame, fg_color=("gray90", "gray15"))
+        self.summary_frame.grid(row=1, column=0, sticky="ew", padx=30, pady=(0, 10))
+        self.summary_frame.grid_remove()
+        
+        self.summary_label = ctk.CTkLabel(
+            self.summary_frame,
+            text="",
+            font=("Segoe UI", 14, "bold")
+        )
+        self.summary_label.pack(side="left", padx=20, pady=15)
+        
+        # Results list, virtualized so only visible rows exist as widgets
+        self.results_list = ResultsListFrame(
             results_frame,
+            on_view=self._view_errors,
+            on_inspect=self._inspect_pdf,
             fg_color="transparent"
         )
-        self.results_list.grid(row=1, column=0, sticky="nsew", padx=20, pady=(0, 20))
+        self.results_list.grid(row=2, column=0, sticky="nsew", padx=20, pady=(0, 20))
     
     def _create_statusbar(self):
         """Create status bar"""
@@ -224,23 +406,40 @@ class MainWindow(ctk.CTk):
     
     def _open_logs(self):
         """Open the log file in default editor"""
-        log_file = config.LOGS_FOLDER / "scanner.log"
-        if log_file.exists():
-            try:
-                os.startfile(log_file)
-                logger.info("Opened log file")
-            except Exception as e:
-                logger.error(f"Failed to open log file: {e}")
-                messagebox.showerror("Error", f"Could not open log file:\n{e}")
+        # Once the log exists it is only ever appended to or rotated, so stat it once
+        if self._log_exists or os.path.exists(LOG_FILE_PATH):
+            self._log_exists = True
+            self._open_externally(LOG_FILE_PATH)
+            logger.debug("Opened log file")
         else:
             messagebox.showinfo("Info", "Log file does not exist yet.")
 
+    def _open_externally(self, path):
+        """
+        Open a file in its default application.
+        os.startfile and the detached launchers return at once, so this never
+        waits on the application (safe from any thread).
+        """
+        # Dialogs return "C:/..." paths on Windows; the shell wants native separators
+        path = os.path.normpath(os.fspath(path))
+        try:
+            if sys.platform == "win32":
+                # ShellExecute takes the path as-is, so characters such as & are safe
+                os.startfile(path)
+            elif sys.platform == "darwin":
+                subprocess.Popen(["open", path], start_new_session=True, close_fds=True)
+            else:
+                subprocess.Popen(["xdg-open", path], start_new_session=True, close_fds=True)
+        except Exception as e:
+            logger.error(f"Failed to open {path}: {e}")
+            self.after(0, messagebox.showerror, "Error", f"Could not open file:\n{e}")
+
     def _toggle_theme(self):
         """Toggle between dark and light theme"""
         current = ctk.get_appearance_mode()
         new_theme = "Light" if current.lower() == "dark" else "Dark"
         ctk.set_appearance_mode(new_theme)
-        logger.info(f"Theme changed from {current} to {new_theme}")
+        logger.debug(f"Theme changed from {current} to {new_theme}")
     
     def _browse_files(self):
         """Browse for individual PDF files"""
@@ -252,16 +451,35 @@ class MainWindow(ctk.CTk):
         if files:
             self.selected_files = list(files)
             self._update_files_label()
-            logger.info(f"Selected {len(self.selected_files)} files")
+            logger.debug(f"Selected {len(self.selected_files)} files")
     
     def _browse_folder(self):
         """Browse for folder containing PDFs"""
         folder = filedialog.askdirectory(title="Select Folder Containing PDFs")
         
         if folder:
-            self.selected_files = discover_pdfs(folder, recursive=True)
-            self._update_files_label()
-            logger.info(f"Found {len(self.selected_files)} PDF files in folder")
+            self.btn_folder.configure(state="disabled")
+            self._update_status("Discovering PDFs...")
+            
+            # Walk the folder in background so large trees don't freeze the UI. Its own
+            # thread: queued behind a scan and an annotation, it would appear to hang
+            threading.Thread(target=self._discover_thread, args=(folder,), daemon=True).start()
+    
+    def _discover_thread(self, folder: str):
+        """Background thread for PDF discovery"""
+        try:
+            files = self._pdf_listing_cache.discover(folder, recursive=True)
+        except Exception as e:
+            logger.error(f"PDF discovery failed: {e}", exc_info=True)
+            files = []
+        self.after(0, self._on_discover_done, files)
+    
+    def _on_discover_done(self, files: List[str]):
+        """Apply discovered PDFs on the UI thread"""
+        self.selected_files = files
+        self._update_files_label()
+        self.btn_folder.configure(state="normal")
+        self._update_status("Ready")
     
     def _update_files_label(self):
         """Update the selected files label"""
@@ -269,7 +487,7 @@ class MainWindow(ctk.CTk):
         if count == 0:
             self.files_label.configure(text="No files selected")
         elif count == 1:
-            self.files_label.configure(text=f"1 file selected: {Path(self.selected_files[0]).name}")
+            self.files_label.configure(text=f"1 file selected: {basename(self.selected_files[0])}")
         else:
             self.files_label.configure(text=f"{count} files selected")
     
@@ -282,134 +500,153 @@ class MainWindow(ctk.CTk):
         logger.info(f"Starting scan of {len(self.selected_files)} files")
         
         # Clear results
-        for widget in self.results_list.winfo_children():
-            widget.destroy()
+        self.results_list.clear()
+        self.summary_frame.grid_remove()
+        self._stream_counts = {"compliant": 0, "non_compliant": 0, "error": 0}
+        # Browsing stays enabled during a scan, so copy the selection it runs on
+        files = list(self.selected_files)
+        self._stream_total = len(files)
+        self._pending_results.clear()
         self.current_job = None
         
-        # Disable export buttons
+        # Disable export buttons, and the scan button until this scan finishes
         self.btn_export_html.configure(state="disabled")
         self.btn_export_excel.configure(state="disabled")
+        self.btn_scan.configure(state="disabled")
+        self._scanning = True
         
-        # Start scan in background thread
-        thread = threading.Thread(target=self._scan_thread, daemon=True)
-        thread.start()
+        # Start scan in background
+        workers = int(self.workers_menu.get())
+        self._workers.submit(self._scan_thread, files, workers)
     
-    def _scan_thread(self):
+    def _scan_thread(self, files: List[str], workers: int):
         """Background thread for scanning"""
         try:
-            self._update_status("Scanning PDFs...")
+            self.after(0, self._update_status, "Scanning PDFs...")
             
-            # Perform scan
+            # Perform scan; rows are added as each file completes
             job = self.scanner.scan_files(
-                self.selected_files,
-                progress_callback=self._on_progress
+                files,
+                progress_callback=self._on_progress,
+                result_callback=self._on_result,
+                max_workers=workers
             )
             
             self.current_job = job
             
+            # Aggregate and format here; the UI thread only applies the text
+            summary = self._format_summary(
+                job.total_files, job.compliant_count, job.non_compliant_count, job.success_rate
+            )
+            
             # Update UI
-            self.after(0, self._display_results, job)
-            self.after(0, self._update_status, "Scan complete!")
-            self.after(0, lambda: self.btn_export_html.configure(state="normal"))
-            self.after(0, lambda: self.btn_export_excel.configure(state="normal"))
+            self.after(0, self._on_scan_done, job, summary)
             
         except Exception as e:
             logger.error(f"Scan failed: {e}", exc_info=True)
-            self.after(0, self._update_status, f"Scan failed: {e}")
-            self.after(0, messagebox.showerror, "Scan Error", f"Scan failed:\n\n{str(e)}")
+            self.after(0, self._on_scan_failed, str(e))
+    
+    def _end_scan(self):
+        """Mark the scan finished and apply a cache swap deferred while it ran"""
+        self._scanning = False
+        if self._cache_swap_pending:
+            self._cache_swap_pending = False
+            self.scanner.cache = self._create_scan_cache()
+    
+    def _on_scan_done(self, job: ScanJob, summary: str):
+        """Apply all end-of-scan UI updates in one main-thread callback"""
+        self._end_scan()
+        self._flush_pending_progress()
+        self._display_results(job, summary)
+        self._update_status("Scan complete!")
+        self.btn_scan.configure(state="normal")
+        self.btn_export_html.configure(state="normal")
+        self.btn_export_excel.configure(state="normal")
+    
+    def _on_scan_failed(self, error: str):
+        """Report a failed scan (main thread)"""
+        self._end_scan()
+        self._flush_pending_progress()
+        self._update_status(f"Scan failed: {error}")
+        self.btn_scan.configure(state="normal")
+        messagebox.showerror("Scan Error", f"Scan failed:\n\n{error}")
     
     def _on_progress(self, current: int, total: int, filename: str):
-        """Progress callback from scanner"""
-        progress = current / total
-        self.after(0, self.progress_bar.set, progress)
-        self.after(0, self.progress_label.configure, 
-                  text=f"Scanning {current}/{total}: {filename}")
-        self.after(0, self._update_status, f"Scanning: {filename}")
-    
-    def _display_results(self, job: ScanJob):
-        """Display scan results in scrollable list"""
-        # Clear existing
-        for widget in self.results_list.winfo_children():
-            widget.destroy()
-            
-        # Summary Header
-        summary_frame = ctk.CTkFrame(self.results_list, fg_color=("gray90", "gray15"))
-        summary_frame.pack(fill="x", padx=10, pady=(10, 20))
-        
-        ctk.CTkLabel(
-            summary_frame, 
-            text=f"Total: {job.total_files} | Compliant: {job.compliant_count} | Non-Compliant: {job.non_compliant_count} | Success: {job.success_rate:.1f}%",
-            font=("Segoe UI", 14, "bold")
-        ).pack(side="left", padx=20, pady=15)
-
-        # Individual Results
-        for result in job.results:
-            self._add_result_row(result)
+        """Progress callback from scanner (runs on the scan thread)"""
+        # Last write wins: at most one flush is pending, and it shows the latest state
+        self._pending_progress = (current, total, filename)
+        if self._progress_job is None:
+            self._progress_job = self.after(PROGRESS_FLUSH_MS, self._flush_progress)
+    
+    def _flush_progress(self):
+        """Apply the most recent progress update to all progress widgets at once"""
+        # Clear the id before reading so an update arriving meanwhile schedules a new flush
+        self._progress_job = None
+        current, total, filename = self._pending_progress
+        self.progress_bar.set(current / total)
+        self.progress_label.configure(text=f"Scanning {current}/{total}: {filename}")
+        self._update_status(f"Scanning: {filename}")  # Scanner already logs each file
+    
+    def _flush_pending_progress(self):
+        """Apply a pending progress update now, so it cannot land after the final status"""
+        if self._progress_job is not None:
+            self.after_cancel(self._progress_job)
+            self._flush_progress()
 
-    def _add_result_row(self, result: PDFResult):
-        """Add a single result row to the scrollable frame"""
-        row = ctk.CTkFrame(self.results_list, fg_color=("white", "gray20"))
-        row.pack(fill="x", padx=10, pady=5)
-        
-        # Status Icon/Label
-        status_color = "green" if result.compliant else "red"
-        status_text = "✓" if result.compliant else "✗"
-        
-        status_lbl = ctk.CTkLabel(
-            row, 
-            text=status_text, 
-            text_color=status_color,
-            font=("Segoe UI", 20, "bold"),
-            width=40
-        )
-        status_lbl.pack(side="left", padx=(10, 5))
+    def _on_result(self, result: PDFResult):
+        """Result callback from scanner (runs on the scan thread)"""
+        # Queue the result; at most one flush is pending and it takes everything queued
+        self._pending_results.append(result)
+        if not self._results_flush_scheduled:
+            self._results_flush_scheduled = True
+            self.after(PROGRESS_FLUSH_MS, self._flush_results)
+    
+    def _flush_results(self):
+        """Show all queued streamed results with one list update and one summary update"""
+        self._results_flush_scheduled = False
+        batch = []
+        while self._pending_results:
+            batch.append(self._pending_results.popleft())
+        if not batch:
+            return
         
-        # Filename and Violation count
-        info_frame = ctk.CTkFrame(row, fg_color="transparent")
-        info_frame.pack(side="left", fill="both", expand=True, padx=10)
+        self.results_list.extend_results(batch)
+        
+        for result in batch:
+            if result.error:
+                self._stream_counts["error"] += 1
+            elif result.compliant:
+                self._stream_counts["compliant"] += 1
+            else:
+                self._stream_counts["non_compliant"] += 1
+        
+        done = len(self.results_list.results)
+        self._set_summary(self._format_summary(
+            self._stream_total,
+            self._stream_counts["compliant"],
+            self._stream_counts["non_compliant"],
+            self._stream_counts["compliant"] / done * 100
+        ))
+    
+    @staticmethod
+    def _format_summary(total: int, compliant: int, non_compliant: int, success_rate: float) -> str:
+        """Build the summary header text (pure; safe to call from any thread)"""
+        return f"Total: {total} | Compliant: {compliant} | Non-Compliant: {non_compliant} | Success: {success_rate:.1f}%"
+    
+    def _set_summary(self, text: str):
+        """Show the summary header"""
+        self.summary_label.configure(text=text)
+        self.summary_frame.grid()
+    
+    def _display_results(self, job: ScanJob, summary: str):
+        """Display final scan results, in selection order, in the virtualized results list"""
+        # The final list supersedes any streamed results still waiting to be flushed
+        self._pending_results.clear()
         
-        ctk.CTkLabel(
-            info_frame, 
-            text=result.filename,
-            font=("Segoe UI", 13, "bold"),
-            anchor="w"
-        ).pack(fill="x", pady=(5, 0))
+        self._set_summary(summary)
         
-        violation_text = f"{result.total_violations} Violations" if not result.compliant else "Full Compliance"
-        if result.error:
-            violation_text = f"Error: {result.error}"
-            
-        ctk.CTkLabel(
-            info_frame, 
-            text=violation_text,
-            font=("Segoe UI", 11),
-            text_color="gray",
-            anchor="w"
-        ).pack(fill="x", pady=(0, 5))
-        
-        # Action Buttons
-        if not result.compliant and result.violations:
-            btn_view = ctk.CTkButton(
-                row,
-                text="👁 View Annotations",
-                command=lambda r=result: self._view_errors(r),
-                width=140,
-                height=32,
-                fg_color="orange",
-                hover_color="darkorange"
-            )
-            btn_view.pack(side="right", padx=5, pady=10)
-            
-        btn_inspect = ctk.CTkButton(
-            row,
-            text="🔍 Inspect In-App",
-            command=lambda r=result: self._inspect_pdf(r),
-            width=140,
-            height=32,
-            fg_color="#00695c",
-            hover_color="#004d40"
-        )
-        btn_inspect.pack(side="right", padx=(5, 15), pady=10)
+        # Only the visible rows are realized as widgets
+        self.results_list.set_results(job.results)
     
     def _export_html(self):
         """Export results to HTML and open in browser"""
@@ -417,6 +654,8 @@ class MainWindow(ctk.CTk):
             return
         
         try:
+            from services.report_generator import generate_html_report
+            
             # Generate HTML in temp directory
             import tempfile
             temp_dir = tempfile.gettempdir()
@@ -424,11 +663,10 @@ class MainWindow(ctk.CTk):
             filepath = os.path.join(temp_dir, filename)
             
             # Generate and open report
-            generate_html_report(self.current_job, filepath)
+            filepath = generate_html_report(self.current_job, filepath)
             self._update_status(f"Opening HTML report in browser...")
-            webbrowser.open(filepath)
+            webbrowser.open(os.fspath(filepath))
             self._update_status(f"HTML report opened in browser")
-            logger.info(f"HTML report generated: {filepath}")
                 
         except Exception as e:
             logger.error(f"Failed to export HTML: {e}", exc_info=True)
@@ -440,6 +678,8 @@ class MainWindow(ctk.CTk):
             return
         
         try:
+            from services.report_generator import generate_excel_report
+            
             filepath = filedialog.asksaveasfilename(
                 title="Save Excel Report",
                 defaultextension=".xlsx",
@@ -451,7 +691,7 @@ class MainWindow(ctk.CTk):
                 self._update_status(f"Excel report saved: {filepath}")
                 
                 if messagebox.askyesno("Success", "Excel report saved!\n\nOpen file?"):
-                    os.startfile(filepath)
+                    self._open_externally(filepath)
                 
         except Exception as e:
             logger.error(f"Failed to export Excel: {e}", exc_info=True)
@@ -461,30 +701,46 @@ class MainWindow(ctk.CTk):
         """Annotate and view errors in PDF for a specific result"""
         if not target_result:
             return
+        
+        # Ignore repeated clicks while this file is still being annotated
+        if target_result.filepath in self._annotating:
+            return
             
         try:
             self._update_status(f"Generating annotations for {target_result.filename}...")
             
-            # Run in thread to not freeze UI
+            # Run in background to not freeze UI
             def run_annotate():
                 try:
-                    output_path = self.annotator.annotate_pdf(
+                    output_path = self._get_annotator().annotate_pdf(
                         target_result.filepath,
                         target_result.violations
                     )
-                    self.after(0, lambda: self._update_status(f"Opening annotated PDF: {Path(output_path).name}"))
-                    self.after(0, lambda: os.startfile(output_path))
+                    self.after(0, self._set_status_opening, output_path)
+                    self._open_externally(output_path)
                 except Exception as e:
-                    self.after(0, lambda: messagebox.showerror("Error", f"Failed to annotate PDF:\n{e}"))
-                    self.after(0, lambda: self._update_status("Annotation failed"))
+                    logger.error(f"Failed to annotate PDF: {e}", exc_info=True)
+                    # Pass the message, not the exception: `e` is unbound once this block exits
+                    self.after(0, self._on_annotate_error, str(e))
+                finally:
+                    self.after(0, self._annotating.discard, target_result.filepath)
             
-            thread = threading.Thread(target=run_annotate, daemon=True)
-            thread.start()
+            self._workers.submit(run_annotate)
+            self._annotating.add(target_result.filepath)
             
         except Exception as e:
             logger.error(f"Failed to initiate annotation: {e}")
             messagebox.showerror("Error", str(e))
     
+    def _set_status_opening(self, output_path: str):
+        """Report that an annotated PDF is being opened (main thread)"""
+        self._update_status(f"Opening annotated PDF: {basename(output_path)}")
+    
+    def _on_annotate_error(self, error: str):
+        """Report a failed annotation (main thread)"""
+        self._update_status("Annotation failed")
+        messagebox.showerror("Error", f"Failed to annotate PDF:\n{error}")
+    
     def _inspect_pdf(self, target: PDFResult):
         """Open integrated PDF viewer for a specific result"""
         if not target:
@@ -494,7 +750,8 @@ class MainWindow(ctk.CTk):
         self.main_frame.grid_remove()
         
         # Create viewer if needed
-        if not hasattr(self, 'pdf_viewer') or self.pdf_viewer is None:
+        if self.pdf_viewer is None:
+            from gui.pdf_viewer_frame import PDFViewerFrame
             self.pdf_viewer = PDFViewerFrame(self, close_callback=self._close_viewer)
         
         self.pdf_viewer.grid(row=1, column=0, sticky="nsew", padx=10, pady=10)
@@ -503,15 +760,26 @@ class MainWindow(ctk.CTk):
 
     def _close_viewer(self):
         """Close viewer and show results"""
-        if hasattr(self, 'pdf_viewer') and self.pdf_viewer:
+        if self.pdf_viewer:
             self.pdf_viewer.grid_remove()
         self.main_frame.grid()
         self._update_status("Ready")
     
-    def _update_status(self, message: str):
-        """Update status bar"""
+    def _update_status(self, message: str, level: int = logging.DEBUG):
+        """
+        Update status bar, skipping repeats of the current message.
+        
+        Args:
+            message: Status text
+            level: Log level for the status change (the events behind most
+                statuses are already logged where they happen)
+        """
+        if message == self._last_status:
+            return
+        self._last_status = message
         self.statusbar.configure(text=message)
-        logger.info(f"Status: {message}")
+        if logger.isEnabledFor(level):
+            logger.log(level, "Status: %s", message)
 
 
 if __name__ == "__main__":
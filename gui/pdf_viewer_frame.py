@@ -2,12 +2,56 @@ import customtkinter as ctk
 from tkinter import Canvas, NW
 import fitz  # PyMuPDF
 from PIL import Image, ImageTk, ImageDraw
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
+from functools import partial
+import threading
 import logging
+import re
 from pathlib import Path
 
+from gui.tree_list_frame import TreeListFrame, TreeItem, DEFAULT_COLOR
+
 logger = logging.getLogger(__name__)
 
+PIXMAP_CACHE_BYTES = 64 * 1024 * 1024  # Memory budget for cached page rasters
+PREFETCH_OFFSETS = (1, -1, 2, -2)  # Neighbouring pages rasterized ahead of navigation
+# Text in parentheses in a veraPDF context, at least 4 characters long. The negated
+# class matches in linear time and the length filter happens inside the regex.
+CONTEXT_TEXT_RE = re.compile(r'\(([^)\n]{4,})\)')
+LAYER_CACHE_SIZE = 16  # Violation overlay layers kept (cropped to the area they cover)
+# Zoom factors pages are actually rasterized at; zoom levels in between are resampled
+# from the next tier up, and zoom beyond the last tier is upscaled from it
+RENDER_TIERS = (1.0, 2.0, 4.0)
+STORE_SHRINK_PERCENT = 80  # Share of MuPDF's resource store freed when rasters are evicted
+DISPLAY_LIST_CACHE_SIZE = 4  # Parsed pages kept for re-rendering at another tier
+BAND_THRESHOLD_PX = 4 * 1024 * 1024  # Rasters above this many pixels are rendered in bands
+BAND_HEIGHT_PX = 1024  # Height of one band in device pixels
+SEARCH_HIT_MAX = 5  # Context text matches highlighted per violation
+
+ZOOM_DEBOUNCE_MS = 60  # Quiet time after the last zoom click before the page is re-rendered
+PAGE_MARGIN = 10  # Space around the page on the canvas
+CANVAS_BG = ("gray86", "gray17")  # Canvas background (light mode, dark mode)
+WHEEL_UNITS = 3  # Canvas scroll units per mouse wheel notch
+
+# Structure tree text colors by tag type (light mode, dark mode)
+DEFAULT_TAG_COLOR = ("#333333", "#E0E0E0")
+TAG_COLORS = {
+    **dict.fromkeys(("H1", "H2", "H3", "H4", "H5", "H6"), ("#1565C0", "#90CAF9")),  # Blue/Light Blue
+    **dict.fromkeys(("Table", "THead", "TBody", "TR", "TD"), ("#2E7D32", "#A5D6A7")),  # Green/Light Green
+    "Figure": ("#C62828", "#EF5350"),  # Red/Light Red
+}
+
+
+def raster_tier(zoom: float) -> float:
+    """Render tier used for a zoom level"""
+    for tier in RENDER_TIERS:
+        if zoom <= tier:
+            return tier
+    return RENDER_TIERS[-1]
+
+
 class PDFViewerFrame(ctk.CTkFrame):
     """
     Frame for viewing PDF with error highlights and navigation tree.
@@ -21,8 +65,35 @@ class PDFViewerFrame(ctk.CTkFrame):
         self.zoom_level = 1.0
         self.current_result: Any = None
         self.violations_by_page = {}
+        self._violation_page: Dict[int, int] = {}  # id(violation) -> page it is listed under
         self.highlight_node = None # For structure tags
         
+        # Rasterized pages: (page_idx, tier) -> (RGB bytes, width, height), least recently used first
+        self._pix_cache: "OrderedDict[Tuple[int, float], Tuple[bytes, int, int]]" = OrderedDict()
+        self._pix_cache_bytes = 0
+        # Unfocused violation overlays: (page_idx, zoom) -> (RGBA layer, offset) or None
+        self._layer_cache: "OrderedDict[Tuple[int, float], Optional[Tuple[Image.Image, Tuple[int, int]]]]" = OrderedDict()
+        # Parsed page content: page_idx -> fitz.DisplayList, least recently used first
+        self._display_lists: "OrderedDict[int, Any]" = OrderedDict()
+        # Located violations: (page_idx, id(violation)) -> rects, and page_idx -> {xref: rects}
+        self._rects_cache: Dict[Tuple[int, int], List[Any]] = {}
+        self._xref_rects_cache: Dict[int, Dict[int, List[Any]]] = {}
+        # page_idx -> (page.get_text("words"), casefolded word -> word positions)
+        self._words_cache: Dict[int, Tuple[List[tuple], Dict[str, List[int]]]] = {}
+        # (page_idx, context text) -> rects found for it
+        self._search_cache: Dict[Tuple[int, str], List[Any]] = {}
+        # (page_idx, id(structure node)) -> rects of its marked content
+        self._mcid_rects_cache: Dict[Tuple[int, int], List[Any]] = {}
+        
+        # Rendering runs on one background thread. PyMuPDF is not thread-safe, so
+        # every use of self.doc (and the raster cache) happens under _doc_lock.
+        self._render_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-render")
+        self._doc_lock = threading.Lock()
+        self._render_seq = 0  # Id of the latest render request; older results are dropped
+        self._last_render_key = None  # (page, zoom, id(highlight), id(tag)) of the latest request
+        self._zoom_job = None  # Pending debounced render after a zoom change
+        self._page_count = 0
+        
         self.grid_columnconfigure(1, weight=1)
         self.grid_columnconfigure(2, weight=0) # Right panel for structure
         self.grid_rowconfigure(0, weight=1)
@@ -42,7 +113,7 @@ class PDFViewerFrame(ctk.CTkFrame):
             ctk.CTkButton(header_left, text="⬅ Back", width=60, command=self.close_callback, fg_color="gray50").pack(side="right", padx=5)
             
         # Error Tree area
-        self.error_tree = ctk.CTkScrollableFrame(self.left_panel, label_text="Violations by Page")
+        self.error_tree = TreeListFrame(self.left_panel, label_text="Violations by Page")
         self.error_tree.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
         
         # --- Middle Panel: PDF View ---
@@ -66,14 +137,32 @@ class PDFViewerFrame(ctk.CTkFrame):
         ctk.CTkButton(self.toolbar, text="Prev", width=60, command=self.prev_page).pack(side="left", padx=5)
         ctk.CTkButton(self.toolbar, text="Next", width=60, command=self.next_page).pack(side="left", padx=5)
         
-        # Scrollable Image Area
-        # Using a Canvas inside a ScrollableFrame might be tricky for scrolling both directions.
-        # Let's use a standard ScrollableFrame that contains a Label with the image.
-        self.viewer_scroll = ctk.CTkScrollableFrame(self.right_panel)
-        self.viewer_scroll.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
+        # Scrollable Image Area: one canvas image item backed by a single PhotoImage,
+        # which is pasted into (not recreated) while the page size stays the same
+        self.viewer_frame = ctk.CTkFrame(self.right_panel)
+        self.viewer_frame.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
+        self.viewer_frame.grid_rowconfigure(0, weight=1)
+        self.viewer_frame.grid_columnconfigure(0, weight=1)
+        
+        self.viewer_canvas = Canvas(
+            self.viewer_frame,
+            highlightthickness=0,
+            bg=self._apply_appearance_mode(CANVAS_BG)
+        )
+        self.viewer_canvas.grid(row=0, column=0, sticky="nsew")
+        v_scroll = ctk.CTkScrollbar(self.viewer_frame, command=self.viewer_canvas.yview)
+        v_scroll.grid(row=0, column=1, sticky="ns")
+        h_scroll = ctk.CTkScrollbar(self.viewer_frame, orientation="horizontal", command=self.viewer_canvas.xview)
+        h_scroll.grid(row=1, column=0, sticky="ew")
+        self.viewer_canvas.configure(yscrollcommand=v_scroll.set, xscrollcommand=h_scroll.set)
+        
+        self._tk_photo: Optional[ImageTk.PhotoImage] = None
+        self._img_id = self.viewer_canvas.create_image(PAGE_MARGIN, PAGE_MARGIN, anchor=NW)
+        self._msg_id = self.viewer_canvas.create_text(PAGE_MARGIN, PAGE_MARGIN, anchor=NW, text="", fill="red")
         
-        self.image_label = ctk.CTkLabel(self.viewer_scroll, text="")
-        self.image_label.pack(expand=True, fill="both", padx=10, pady=10)
+        self.viewer_canvas.bind("<MouseWheel>", self._on_canvas_wheel)
+        self.viewer_canvas.bind("<Button-4>", self._on_canvas_wheel)
+        self.viewer_canvas.bind("<Button-5>", self._on_canvas_wheel)
 
         # --- Right Panel: Logical Structure Tree ---
         self.structure_panel = ctk.CTkFrame(self, width=250, fg_color=("gray90", "gray20"))
@@ -85,109 +174,147 @@ class PDFViewerFrame(ctk.CTkFrame):
         header_right.grid(row=0, column=0, sticky="ew", padx=5, pady=5)
         ctk.CTkLabel(header_right, text="Logical Structure", font=("Segoe UI", 14, "bold")).pack(side="left", padx=10)
 
-        self.struct_tree = ctk.CTkScrollableFrame(self.structure_panel, label_text="Document Tags")
+        # Virtualized: tagged PDFs can have thousands of structure elements
+        self.struct_tree = TreeListFrame(self.structure_panel, label_text="Document Tags")
         self.struct_tree.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
 
     def load_document(self, result: Any):
         """Load a PDF document and results"""
         self.current_result = result
         try:
-            if self.doc:
-                self.doc.close()
-            
-            logger.info(f"Loading PDF for inspection: {result.filepath}")
-            self.doc = fitz.open(result.filepath)
-            
-            # 1. Organize violations by page with robust resolution
-            from utils.pdf_utils import build_xref_page_map, resolve_violation_page
-            xref_map = build_xref_page_map(self.doc)
-            
-            self.violations_by_page = {}
-            for v in result.violations:
-                p_idx = resolve_violation_page(v, self.doc, xref_map)
+            # Bumped before taking the lock: an in-flight banded render sees the new seq
+            # and gives up between bands, and queued renders for the old document go stale
+            self._render_seq += 1
+            self._last_render_key = None
+            # Waits for an in-flight render to finish with the old document
+            with self._doc_lock:
+                if self.doc is not None:
+                    self.doc.close()
+                    self.doc = None
+                    self._page_count = 0
                 
-                if p_idx is None:
-                    p_idx = 0 # Default global to page 0 for display
+                logger.info(f"Loading PDF for inspection: {result.filepath}")
+                self.doc = fitz.open(result.filepath)
+                self._page_count = self.doc.page_count
+                self._clear_page_caches()
                 
-                if p_idx not in self.violations_by_page:
-                    self.violations_by_page[p_idx] = []
-                self.violations_by_page[p_idx].append(v)
-            
-            # 2. Populate Trees
-            self._populate_error_tree()
-            self._populate_structure_tree()
+                # 1. Organize violations by page with robust resolution
+                from utils.pdf_utils import build_xref_page_map, resolve_violation_page
+                xref_map = build_xref_page_map(self.doc)
+                
+                self.violations_by_page = {}
+                self._violation_page = {}
+                for v in result.violations:
+                    p_idx = resolve_violation_page(v, self.doc, xref_map)
+                    
+                    if p_idx is None:
+                        p_idx = 0 # Default global to page 0 for display
+                    
+                    if p_idx not in self.violations_by_page:
+                        self.violations_by_page[p_idx] = []
+                    self.violations_by_page[p_idx].append(v)
+                    self._violation_page[id(v)] = p_idx
+                
+                # 2. Populate the error tree; tags are collected after the first page renders
+                self._populate_error_tree()
             
             self.current_page_idx = 0
             self._render_page()
+            self._load_structure_tree()
             
         except Exception as e:
             logger.error(f"Failed to load PDF: {e}", exc_info=True)
-            self.image_label.configure(text=f"Error loading PDF: {e}")
+            self._show_message(f"Error loading PDF: {e}")
 
     def _populate_error_tree(self):
         """Populate the left sidebar with pages and errors"""
-        # Clear existing
-        for widget in self.error_tree.winfo_children():
-            widget.destroy()
-            
         if not self.doc:
+            self.error_tree.clear()
             return
 
-        # Add Global/Document errors first (Page 0/Unmapped)
-        if 0 in self.violations_by_page:
-             # Just checking if we have effectively global errors mapped to 0
-             pass
-
-        total_pages = len(self.doc)
-        
-        for p_idx in range(total_pages):
-            # Page Header
-            page_btn = ctk.CTkButton(
-                self.error_tree, 
-                text=f"Page {p_idx + 1}", 
-                fg_color="transparent", 
-                text_color=("gray10", "gray90"),
-                anchor="w",
-                command=lambda p=p_idx: self.go_to_page(p),
-                height=28
-            )
-            page_btn.pack(fill="x", padx=2, pady=1)
-            
-            # Errors on this page
-            if p_idx in self.violations_by_page:
-                violations = self.violations_by_page[p_idx]
-                for v in violations:
-                    # Identifier for the error
-                    rule = v.rule_id
-                    desc = v.description[:40] + "..." if len(v.description) > 40 else v.description
-                    
-                    err_btn = ctk.CTkButton(
-                        self.error_tree,
-                        text=f"⚠ {rule}",
-                        font=("Segoe UI", 11, "bold"),
-                        fg_color=("#ef5350", "#c62828") if v.failed_checks > 1 else ("#B3E5FC", "#0288D1"),
-                        hover_color=("#e53935", "#b71c1c") if v.failed_checks > 1 else ("#81D4FA", "#0277BD"),
-                        text_color="white" if v.failed_checks > 1 else ("black", "white"), 
-                        anchor="w",
-                        height=26,
-                        command=lambda p=p_idx, viol=v: self.focus_error(p, viol)
-                    )
-                    err_btn.pack(fill="x", padx=(15, 2), pady=1)
-
-    def _populate_structure_tree(self):
-        """Populate the right sidebar with logical tags or document outline"""
-        for widget in self.struct_tree.winfo_children():
-            widget.destroy()
-            
-        if not self.doc: return
+        # Only pages with errors are listed; the rest are behind the "Other pages" row
+        items: List[TreeItem] = []
+        for p_idx, violations in sorted(self.violations_by_page.items()):
+            items.append(self._page_item(p_idx))
+            for v in violations:
+                items.append(self._violation_item(p_idx, v))
+        
+        other_count = self._page_count - len(self.violations_by_page)
+        if other_count > 0:
+            items.append(TreeItem(f"▸ Other pages ({other_count})", color="gray", command=self._expand_other_pages))
+        
+        # Only the rows in view are realized as widgets
+        self.error_tree.set_items(items)
+
+    def _expand_other_pages(self):
+        """Replace the "Other pages" row with a header for every page without errors"""
+        items = self.error_tree.items[:-1]
+        items.extend(self._page_item(p_idx) for p_idx in range(self._page_count) if p_idx not in self.violations_by_page)
+        self.error_tree.set_items(items, keep_position=True)
+
+    def _page_item(self, p_idx) -> TreeItem:
+        """Build a page header row"""
+        return TreeItem(f"Page {p_idx + 1}", 0, DEFAULT_COLOR, partial(self.go_to_page, p_idx))
+
+    def _violation_item(self, p_idx, v) -> TreeItem:
+        """Build a violation row under its page"""
+        severe = v.failed_checks > 1
+        return TreeItem(
+            f"⚠ {v.rule_id}",
+            1,
+            "white" if severe else ("black", "white"),
+            partial(self.focus_error, p_idx, v),
+            ("#ef5350", "#c62828") if severe else ("#B3E5FC", "#0288D1")
+        )
+
+    def _load_structure_tree(self):
+        """
+        Fill the right sidebar in the background. The job queues behind the first
+        page render on the render thread, so the page appears before tags are walked.
+        """
+        self.struct_tree.set_items([TreeItem("Loading tags...", color="gray")])
+        future = self._render_pool.submit(self._structure_job, self.doc)
+        future.add_done_callback(partial(self._on_structure_done, self.doc))
+
+    def _structure_job(self, doc) -> Optional[List[TreeItem]]:
+        """Build the structure rows (runs on the render thread, no Tk calls)"""
+        with self._doc_lock:
+            if doc is not self.doc:
+                return None  # Another document was loaded meanwhile
+            return self._build_structure_items()
+
+    def _on_structure_done(self, doc, future: Future):
+        """Hand the structure rows back to the Tk thread (called on the render thread)"""
+        if future.cancelled():
+            return  # Frame is being destroyed
+        self.after(0, self._show_structure, doc, future)
+
+    def _show_structure(self, doc, future: Future):
+        """Display the structure rows unless another document was loaded meanwhile"""
+        if doc is not self.doc:
+            return
+        try:
+            items = future.result()
+        except Exception as e:
+            logger.warning(f"Failed to build structure tree: {e}")
+            items = [TreeItem("No structure found (No Tags or Bookmarks)", color="gray")]
+        if items is not None:
+            # Only the rows in view are realized as widgets
+            self.struct_tree.set_items(items)
+
+    def _build_structure_items(self) -> List[TreeItem]:
+        """Collect sidebar rows for the logical tags, or the document outline (call under _doc_lock)"""
+        items: List[TreeItem] = []
+        if not self.doc:
+            return items
         
         # 1. Try Pre-extracted Structure Tree (from Scanner)
         found_structure = False
         try:
-            if hasattr(self.current_result, "structure_tree") and self.current_result.structure_tree:
-                logger.info(f"Using {len(self.current_result.structure_tree)} pre-extracted structure nodes.")
-                for node in self.current_result.structure_tree:
-                    self._add_structure_node(node, 0)
+            pre_extracted = getattr(self.current_result, "structure_tree", None)
+            if pre_extracted:
+                logger.info(f"Using {len(pre_extracted)} pre-extracted structure nodes.")
+                self._add_structure_nodes(items, pre_extracted)
                 found_structure = True
             
             # 2. If not pre-extracted, try to extract on-the-fly (tier 2 fallback)
@@ -196,11 +323,11 @@ class PDFViewerFrame(ctk.CTkFrame):
                 struct_tree = get_logical_structure(self.doc)
                 if struct_tree:
                     logger.info("Extracted logical tags on-the-fly.")
-                    for node in struct_tree:
-                        self._add_structure_node(node, 0)
+                    self._add_structure_nodes(items, struct_tree)
                     found_structure = True
         except Exception as e:
             logger.warning(f"Failed to load structure tree: {e}")
+            items.clear()
 
         # 2. Fallback to Document Outline (Bookmarks/TOC) if no tags found
         if not found_structure:
@@ -208,83 +335,47 @@ class PDFViewerFrame(ctk.CTkFrame):
                 toc = self.doc.get_toc()
                 if toc:
                     logger.info("Logical tags not found. Falling back to Table of Contents...")
-                    ctk.CTkLabel(
-                        self.struct_tree, 
-                        text="Tags not found. Showing TOC:", 
-                        font=("Segoe UI", 11, "italic"),
-                        text_color="gray"
-                    ).pack(pady=(0, 5), fill="x")
+                    items.append(TreeItem("Tags not found. Showing TOC:", color="gray"))
                     for level, title, page in toc:
-                        self._add_toc_node(title, page - 1, level)
+                        items.append(self._toc_item(title, page - 1, level))
                     found_structure = True
             except Exception as e:
                 logger.warning(f"Failed to get document outline: {e}")
 
         if not found_structure:
-            ctk.CTkLabel(
-                self.struct_tree, 
-                text="No structure found\n(No Tags or Bookmarks)", 
-                text_color="gray",
-                font=("Segoe UI", 12)
-            ).pack(pady=20)
-
-    def _add_structure_node(self, node, level):
-        """Recursively add structure nodes to the UI with improved styling"""
-        if not node: return
-        
-        tag = node.get("tag", "Unknown")
-        title = node.get("title", "")
-        xref = node.get("xref", -1)
-        text = f"{tag}" + (f": {title[:20]}" if title else "")
-        
-        # Determine color/styling based on tag type
-        # Light mode: Dark Indigo/Green/Red
-        # Dark mode: Light Blue/Light Green/Light Red
-        color = ("#333333", "#E0E0E0")
-        if tag in ["H1", "H2", "H3", "H4", "H5", "H6"]:
-            color = ("#1565C0", "#90CAF9") # Blue/Light Blue
-        elif tag in ["Table", "THead", "TBody", "TR", "TD"]:
-            color = ("#2E7D32", "#A5D6A7") # Green/Light Green
-        elif tag == "Figure":
-            color = ("#C62828", "#EF5350") # Red/Light Red
-        
-        btn = ctk.CTkButton(
-            self.struct_tree,
-            text=text,
-            fg_color="transparent",
-            hover_color=("gray85", "gray30"),
-            text_color=color,
-            anchor="w",
-            font=("Segoe UI", 11, "bold"),
-            height=24,
-            command=lambda n=node: self.focus_tag(n),
-            state="normal" 
-        )
-        btn.pack(fill="x", padx=(level * 15, 2), pady=0)
-        
-        # Add children
-        children = node.get("children", [])
-        for child in children:
-            self._add_structure_node(child, level + 1)
-
-    def _add_toc_node(self, title, page_idx, level):
-        """Adds a TOC entry to the UI with nice styling"""
-        btn = ctk.CTkButton(
-            self.struct_tree,
-            text=f"🔖 {title}",
-            fg_color="transparent",
-            hover_color=("gray85", "gray30"),
-            text_color=("gray10", "gray90"),
-            anchor="w",
-            font=("Segoe UI", 11, "bold"),
-            height=24,
-            command=lambda p=page_idx: self.go_to_page(p)
-        )
-        btn.pack(fill="x", padx=((level - 1) * 15, 2), pady=1)
+            items.append(TreeItem("No structure found (No Tags or Bookmarks)", color="gray"))
+        return items
 
+    def _add_structure_nodes(self, items: List[TreeItem], roots):
+        """Flatten structure nodes into tree rows (iterative depth-first, children in order)"""
+        # Bound once; this loop runs for every tag in the document
+        append_item = items.append
+        focus_tag = self.focus_tag
+        tag_colors = TAG_COLORS
+        
+        stack = [(node, 0) for node in reversed(roots)]
+        push = stack.append
+        while stack:
+            node, level = stack.pop()
+            if not node:
+                continue
+            
+            tag = node.get("tag", "Unknown")
+            title = node.get("title", "")
+            text = f"{tag}: {title[:20]}" if title else tag
+            
+            append_item(TreeItem(text, level, tag_colors.get(tag, DEFAULT_TAG_COLOR), partial(focus_tag, node)))
+            
+            # Add children
+            for child in reversed(node.get("children", ())):
+                push((child, level + 1))
+
+    def _toc_item(self, title, page_idx, level) -> TreeItem:
+        """Build a TOC entry row"""
+        return TreeItem(f"🔖 {title}", level - 1, DEFAULT_COLOR, partial(self.go_to_page, page_idx))
 
     def go_to_page(self, page_idx):
-        if 0 <= page_idx < len(self.doc):
+        if 0 <= page_idx < self._page_count:
             self.current_page_idx = page_idx
             self._render_page()
 
@@ -295,9 +386,13 @@ class PDFViewerFrame(ctk.CTkFrame):
         self.go_to_page(self.current_page_idx + 1)
         
     def change_zoom(self, delta):
-        self.zoom_level = max(0.2, min(5.0, self.zoom_level + delta))
+        # Rounded so repeated +/-0.1 steps land exactly on the raster tiers
+        self.zoom_level = round(max(0.2, min(5.0, self.zoom_level + delta)), 2)
         self.lbl_zoom.configure(text=f"{int(self.zoom_level * 100)}%")
-        self._render_page()
+        # The label updates right away; the render waits until the clicks stop
+        if self._zoom_job is not None:
+            self.after_cancel(self._zoom_job)
+        self._zoom_job = self.after(ZOOM_DEBOUNCE_MS, self._render_page)
 
     def focus_error(self, page_idx, violation):
         """Switch to page and highlight specific error"""
@@ -314,117 +409,442 @@ class PDFViewerFrame(ctk.CTkFrame):
         self._render_page()
 
     def _render_page(self, highlight_violation=None):
-        """Render current page to image"""
-        if not self.doc:
+        """Request a render of the current page; the work runs on the render thread"""
+        # Any render picks up the current zoom, so a pending zoom render is redundant
+        if self._zoom_job is not None:
+            self.after_cancel(self._zoom_job)
+            self._zoom_job = None
+        
+        if self.doc is None:
             return
-            
-        page = self.doc[self.current_page_idx]
+        
+        # Nothing changed since the last request (double clicks, re-focusing the same error)
+        render_key = (self.current_page_idx, self.zoom_level, id(highlight_violation), id(self.highlight_node))
+        if render_key == self._last_render_key:
+            return
+        self._last_render_key = render_key
         
         # Create clear label text
-        self.lbl_page.configure(text=f"Page: {self.current_page_idx + 1}/{len(self.doc)}")
+        self.lbl_page.configure(text=f"Page: {self.current_page_idx + 1}/{self._page_count}")
         
-        # Render page to pixmap
-        mat = fitz.Matrix(self.zoom_level, self.zoom_level)
-        pix = page.get_pixmap(matrix=mat)
+        self._render_seq += 1
+        seq = self._render_seq
+        future = self._render_pool.submit(
+            self._render_job,
+            seq,
+            self.current_page_idx,
+            self._display_zoom(),
+            highlight_violation,
+            self.highlight_node
+        )
+        future.add_done_callback(partial(self._on_render_done, seq))
+
+    def _on_render_done(self, seq: int, future: Future):
+        """Hand a finished render back to the Tk thread (called on the render thread)"""
+        if future.cancelled():
+            return  # Frame is being destroyed
+        self.after(0, self._show_render, seq, future)
+
+    def _show_render(self, seq: int, future: Future):
+        """Display a finished render unless a newer request superseded it"""
+        if seq != self._render_seq:
+            return
         
-        # Convert to PIL
-        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+        try:
+            img = future.result()
+        except Exception as e:
+            logger.error(f"Failed to render page {self.current_page_idx + 1}: {e}", exc_info=True)
+            self._last_render_key = None  # Allow retrying the same view
+            self._show_message(f"Error rendering page: {e}")
+            return
+        
+        if img is None:
+            return
+        
+        # Display: reuse the Tk photo when the size matches, otherwise replace it
+        if self._tk_photo is not None and (self._tk_photo.width(), self._tk_photo.height()) == img.size:
+            self._tk_photo.paste(img)
+        else:
+            self._tk_photo = ImageTk.PhotoImage(img)
+            self.viewer_canvas.itemconfigure(self._img_id, image=self._tk_photo)
+            self.viewer_canvas.configure(
+                scrollregion=(0, 0, img.width + 2 * PAGE_MARGIN, img.height + 2 * PAGE_MARGIN)
+            )
+        self.viewer_canvas.itemconfigure(self._img_id, state="normal")
+        self.viewer_canvas.itemconfigure(self._msg_id, text="")
+        
+        # Read ahead while the user looks at this page
+        zoom = self._display_zoom()
+        for offset in PREFETCH_OFFSETS:
+            page_idx = self.current_page_idx + offset
+            if 0 <= page_idx < self._page_count:
+                self._render_pool.submit(self._prefetch_page, seq, page_idx, zoom)
+
+    def _show_message(self, text: str):
+        """Show an error message in place of the page"""
+        self.viewer_canvas.itemconfigure(self._img_id, state="hidden")
+        self.viewer_canvas.itemconfigure(self._msg_id, text=text)
+
+    def _display_zoom(self) -> float:
+        """Zoom to render at: the user zoom times the UI scaling CTk applies on HiDPI screens"""
+        return round(self.zoom_level * self._get_widget_scaling(), 2)
+
+    def _on_canvas_wheel(self, event):
+        """Scroll the page vertically, or horizontally with Shift held"""
+        if event.num == 4:
+            step = -WHEEL_UNITS
+        elif event.num == 5:
+            step = WHEEL_UNITS
+        else:
+            step = -WHEEL_UNITS if event.delta > 0 else WHEEL_UNITS
+        if event.state & 0x1:  # Shift
+            self.viewer_canvas.xview_scroll(step, "units")
+        else:
+            self.viewer_canvas.yview_scroll(step, "units")
+
+    def _set_appearance_mode(self, mode_string):
+        super()._set_appearance_mode(mode_string)
+        self.viewer_canvas.configure(bg=self._apply_appearance_mode(CANVAS_BG))
+
+    def _render_job(self, seq: int, page_idx: int, zoom: float, highlight_violation, highlight_node) -> Optional[Image.Image]:
+        """
+        Rasterize a page and draw its overlays (runs on the render thread, no Tk calls).
+        
+        Returns:
+            The composed page image, or None if the request was superseded before it started
+        """
+        with self._doc_lock:
+            if seq != self._render_seq:
+                return None
+            
+            page = self.doc[page_idx]
+            # Rasterize at the nearest tier and resample to the zoom in between
+            tier = raster_tier(zoom)
+            pixels = self._get_page_pixels(page, page_idx, tier, seq)
+            if pixels is None:
+                return None  # Superseded mid-render
+            samples, width, height = pixels
+            size = (width, height)
+            if zoom != tier:
+                size = (max(1, round(width * zoom / tier)), max(1, round(height * zoom / tier)))
+            layer = self._get_violation_layer(page, page_idx, zoom, size)
+            
+            focus_rects = None
+            # Identity lookup; a list membership test would compare dataclass fields of every violation
+            if highlight_violation is not None and self._violation_page.get(id(highlight_violation)) == page_idx:
+                focus_rects = self._find_violation_rects(page, highlight_violation)
+            
+            tag_rects = None
+            if highlight_node:
+                tag_rects = self._get_tag_rects(page, page_idx, highlight_node)
+        
+        # Wrap the raster without copying; resizing or compositing below makes a
+        # private copy, so the cached bytes stay clean
+        img = Image.frombuffer("RGB", (width, height), samples, "raw", "RGB", 0, 1)
+        if size != img.size:
+            img = img.resize(size, Image.Resampling.BILINEAR)
+        if layer is not None:
+            layer_img, offset = layer
+            img.paste(layer_img, offset, layer_img)
+        self._draw_highlights(img, zoom, focus_rects, highlight_node, tag_rects)
+        return img
+
+    def _get_violation_layer(self, page, page_idx: int, zoom: float, size: Tuple[int, int]) -> Optional[Tuple[Image.Image, Tuple[int, int]]]:
+        """
+        Return the overlay with every violation on a page drawn unfocused (call under _doc_lock).
+        
+        The layer does not depend on which error or tag is focused, so it is drawn
+        once per (page, zoom) and reused. It is cropped to the area it covers.
+        
+        Returns:
+            (RGBA layer, top-left offset on the page), or None if nothing is drawn
+        """
+        key = (page_idx, round(zoom, 2))
+        if key in self._layer_cache:
+            self._layer_cache.move_to_end(key)
+            return self._layer_cache[key]
+        
+        layer = None
+        violations = self.violations_by_page.get(page_idx, ())
+        if violations:
+            overlay = Image.new("RGBA", size, (0, 0, 0, 0))
+            draw = ImageDraw.Draw(overlay)
+            for v in violations:
+                for r in self._find_violation_rects(page, v):
+                    # Scale rect by zoom
+                    scaled_r = [c * zoom for c in r] # x0, y0, x1, y1
+                    draw.rectangle(scaled_r, fill=(255, 100, 0, 40), outline=(255, 100, 0, 150), width=1)
+            bbox = overlay.getbbox()
+            if bbox:
+                layer = (overlay.crop(bbox), bbox[:2])
+        
+        self._layer_cache[key] = layer
+        while len(self._layer_cache) > LAYER_CACHE_SIZE:
+            self._layer_cache.popitem(last=False)
+        return layer
+
+    def _get_tag_rects(self, page, page_idx: int, node) -> List[Any]:
+        """Rects of a structure node's marked content, memoized per document (call under _doc_lock)"""
+        key = (page_idx, id(node))
+        rects = self._mcid_rects_cache.get(key)
+        if rects is None:
+            from utils.pdf_utils import map_mcids_to_rects
+            rects = map_mcids_to_rects(page, node.get("mcids", []))
+            self._mcid_rects_cache[key] = rects
+        return rects
+
+    def _prefetch_page(self, seq: int, page_idx: int, zoom: float):
+        """
+        Warm the raster cache for a page (runs on the render thread).
+        Skipped once the user has requested another render, so prefetches
+        queued ahead of it cost next to nothing.
+        """
+        with self._doc_lock:
+            tier = raster_tier(zoom)
+            if seq != self._render_seq or (page_idx, tier) in self._pix_cache:
+                return
+            try:
+                self._get_page_pixels(self.doc[page_idx], page_idx, tier, seq)
+            except Exception as e:
+                logger.debug(f"Prefetch of page {page_idx + 1} failed: {e}")
+
+    def _draw_highlights(self, img, zoom, focus_rects, highlight_node, tag_rects):
+        """Draw the focused violation and tag highlights onto a page image"""
+        if focus_rects is None and not highlight_node:
+            return
         draw = ImageDraw.Draw(img, "RGBA")
         
-        # Draw all errors for this page
-        if self.current_page_idx in self.violations_by_page:
-            for v in self.violations_by_page[self.current_page_idx]:
-                 # Find rects
-                 rects = self._find_violation_rects(page, v)
-                 is_focused = (v == highlight_violation)
-                 
-                 color = (255, 0, 0, 100) if is_focused else (255, 100, 0, 40)
-                 border = (255, 0, 0, 255) if is_focused else (255, 100, 0, 150)
-                 width = 3 if is_focused else 1
-                 
-                 if rects:
-                     for r in rects:
-                         # Scale rect by zoom
-                         scaled_r = [c * self.zoom_level for c in r] # x0, y0, x1, y1
-                         draw.rectangle(scaled_r, fill=color, outline=border, width=width)
-                 
-                 # If focused but no rect, show text overlay?
-                 if is_focused and not rects:
-                      draw.text((10, 10), "Global/Structure Error - Location not visual", fill="red")
+        if focus_rects:
+            for r in focus_rects:
+                scaled_r = [c * zoom for c in r]
+                draw.rectangle(scaled_r, fill=(255, 0, 0, 100), outline=(255, 0, 0, 255), width=3)
+        elif focus_rects is not None:
+            # Focused but no rect
+            draw.text((10, 10), "Global/Structure Error - Location not visual", fill="red")
 
         # Draw Tag Highlight
-        if self.highlight_node:
-            from utils.pdf_utils import map_mcids_to_rects
-            mcids = self.highlight_node.get("mcids", [])
-            tag_rects = map_mcids_to_rects(page, mcids)
-            
+        if highlight_node:
             if tag_rects:
                 for r in tag_rects:
-                    scaled_r = [c * self.zoom_level for c in r]
+                    scaled_r = [c * zoom for c in r]
                     draw.rectangle(scaled_r, fill=(0, 100, 255, 100), outline=(0, 100, 255, 255), width=3)
             else:
                 # If no MCID rects, show a hint
-                tag_name = self.highlight_node.get('tag', 'Unknown')
+                tag_name = highlight_node.get('tag', 'Unknown')
                 draw.text((10, 10), f"Tag: {tag_name} - Selection shown in structure tree", fill="blue")
 
-        # Display
-        ctk_img = ctk.CTkImage(light_image=img, dark_image=img, size=(pix.width, pix.height))
-        self.image_label.configure(image=ctk_img)
-        self.image_label.image = ctk_img # keep ref
+    def destroy(self):
+        """Stop the render thread along with the frame"""
+        if self._zoom_job is not None:
+            self.after_cancel(self._zoom_job)
+            self._zoom_job = None
+        self._render_seq += 1
+        self._render_pool.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+
+    def _get_page_pixels(self, page, page_idx: int, tier: float, seq: Optional[int] = None) -> Optional[Tuple[bytes, int, int]]:
+        """
+        Return the RGB raster of a page at a render tier, from the LRU cache when possible (call under _doc_lock).
+        
+        Args:
+            seq: Render request this raster is for; large rasters are abandoned
+                between bands once a newer request exists
+        
+        Returns:
+            (RGB bytes, width, height), or None if abandoned
+        """
+        key = (page_idx, tier)
+        entry = self._pix_cache.get(key)
+        if entry is not None:
+            self._pix_cache.move_to_end(key)
+            return entry
+        
+        mat = fitz.Matrix(tier, tier)
+        full_rect = page.rect * mat
+        if full_rect.width * full_rect.height <= BAND_THRESHOLD_PX:
+            # Explicit RGB without alpha matches the "RGB" raw layout frombuffer expects
+            display_list = self._get_display_list(page, page_idx)
+            pix = display_list.get_pixmap(matrix=mat, colorspace=fitz.csRGB, alpha=False)
+        else:
+            pix = self._rasterize_in_bands(page, page_idx, mat, full_rect, seq)
+            if pix is None:
+                return None
+        # The cached bytes are a detached copy, so drop the pixmap now instead of
+        # leaving its MuPDF buffer alive until the next garbage collection
+        entry = (bytes(pix.samples), pix.width, pix.height)
+        pix = None
+        
+        self._pix_cache[key] = entry
+        self._pix_cache_bytes += len(entry[0])
+        # Evict least recently used rasters, but always keep the one just rendered
+        evicted = False
+        while self._pix_cache_bytes > PIXMAP_CACHE_BYTES and len(self._pix_cache) > 1:
+            _, (old_samples, _, _) = self._pix_cache.popitem(last=False)
+            self._pix_cache_bytes -= len(old_samples)
+            evicted = True
+        if evicted:
+            # Pages that fell out of our cache should not stay decoded in MuPDF's store either
+            fitz.TOOLS.store_shrink(STORE_SHRINK_PERCENT)
+        return entry
+
+    def _get_display_list(self, page, page_idx: int):
+        """
+        Return the parsed content of a page, from a small LRU (call under _doc_lock).
+        Rendering the same page at another tier then skips re-interpreting its content stream.
+        """
+        display_list = self._display_lists.get(page_idx)
+        if display_list is not None:
+            self._display_lists.move_to_end(page_idx)
+            return display_list
+        
+        display_list = page.get_displaylist()
+        self._display_lists[page_idx] = display_list
+        while len(self._display_lists) > DISPLAY_LIST_CACHE_SIZE:
+            self._display_lists.popitem(last=False)
+        return display_list
+
+    def _rasterize_in_bands(self, page, page_idx: int, mat, full_rect, seq: Optional[int]):
+        """
+        Rasterize a large page as horizontal bands rendered from one display list.
+        Content streams are parsed once, and the render can stop between bands
+        when the request is superseded instead of finishing a huge raster nobody will see.
+        
+        Returns:
+            The page pixmap, or None if abandoned
+        """
+        display_list = self._get_display_list(page, page_idx)
+        pix = fitz.Pixmap(fitz.csRGB, full_rect.irect, False)
+        pix.clear_with(255)
+        
+        band_height = BAND_HEIGHT_PX / mat.d  # Band height in page units
+        y = page.rect.y0
+        while y < page.rect.y1:
+            if seq is not None and seq != self._render_seq:
+                return None
+            clip = fitz.Rect(page.rect.x0, y, page.rect.x1, min(y + band_height, page.rect.y1))
+            band = display_list.get_pixmap(matrix=mat, colorspace=fitz.csRGB, alpha=False, clip=clip)
+            pix.copy(band, band.irect)  # Copies the overlap, so rounding at band edges is harmless
+            y += band_height
+        return pix
+
+    def _get_word_index(self, page):
+        """
+        Words on a page and, for each casefolded word, where it occurs.
+        Extracted once per page and shared by all violation lookups (call under _doc_lock).
+        """
+        index = self._words_cache.get(page.number)
+        if index is None:
+            words = page.get_text("words")
+            positions: Dict[str, List[int]] = {}
+            for i, w in enumerate(words):
+                positions.setdefault(w[4].casefold(), []).append(i)
+            index = (words, positions)
+            self._words_cache[page.number] = index
+        return index
+
+    def _search_words(self, page, text: str, hit_max: int) -> List[Any]:
+        """
+        Find text as a run of whole words using the page's word index.
+        
+        Returns:
+            One rect per line of each hit (like page.search_for), or [] if not found
+        """
+        tokens = [t.casefold() for t in text.split()]
+        if not tokens:
+            return []
+        
+        words, positions = self._get_word_index(page)
+        rects = []
+        hits = 0
+        for start in positions.get(tokens[0], ()):
+            run = words[start:start + len(tokens)]
+            if len(run) < len(tokens) or any(w[4].casefold() != t for w, t in zip(run, tokens)):
+                continue
+            
+            # Union of the words on each line (block_no, line_no)
+            line_key = None
+            for w in run:
+                if (w[5], w[6]) != line_key:
+                    line_key = (w[5], w[6])
+                    rects.append(fitz.Rect(w[:4]))
+                else:
+                    rects[-1] |= fitz.Rect(w[:4])
+            
+            hits += 1
+            if hits >= hit_max:
+                break
+        return rects
+
+    def _clear_page_caches(self):
+        """Drop everything cached for the previous document (call under _doc_lock)"""
+        self._pix_cache.clear()
+        self._pix_cache_bytes = 0
+        self._layer_cache.clear()
+        self._display_lists.clear()
+        self._rects_cache.clear()
+        self._xref_rects_cache.clear()
+        self._words_cache.clear()
+        self._search_cache.clear()
+        self._mcid_rects_cache.clear()
 
     def _find_violation_rects(self, page, violation) -> List[Any]:
-        """Find bounding boxes for a violation on the page"""
+        """Find bounding boxes for a violation on the page, memoized per document (call under _doc_lock)"""
+        key = (page.number, id(violation))
+        rects = self._rects_cache.get(key)
+        if rects is None:
+            rects = self._locate_violation(page, violation)
+            self._rects_cache[key] = rects
+        return rects
+
+    def _get_xref_rects(self, page) -> Dict[int, List[Any]]:
+        """
+        Map xref -> rects for the images, annotations and widgets on a page.
+        Built with one pass over the page the first time it is needed (call under _doc_lock).
+        """
+        index = self._xref_rects_cache.get(page.number)
+        if index is not None:
+            return index
+        
+        from utils.pdf_utils import map_xrefs_to_rects
+        index = map_xrefs_to_rects(page)
+        self._xref_rects_cache[page.number] = index
+        return index
+
+    def _locate_violation(self, page, violation) -> List[Any]:
+        """Locate a violation on the page by object xref, falling back to its context text"""
         rects = []
-        target_xref = -1
         
         # 1. Try XREF-based lookup (Images, Annotations, Widgets)
-        if violation.object_id:
-            try:
-                target_xref = int(violation.object_id.split()[0])
-                
-                # A. Images
-                images = page.get_images(full=True)
-                for img in images:
-                    if img[0] == target_xref:
-                        rects.extend(page.get_image_rects(target_xref))
-                
-                # B. Annotations & Widgets (Links, Form Fields, etc.)
-                for ann in page.anns:
-                    if ann.xref == target_xref:
-                        rects.append(ann.rect)
-                        
-                for widget in page.widgets():
-                    if widget.xref == target_xref:
-                        rects.append(widget.rect)
-                        
-                # C. Links specifically (sometimes separate from anns in older pymupdf?)
-                # page.get_links() returns dicts, not objects with xrefs usually, unless we use 'links' generator
-                # page.anns covers most interactive elements.
-                        
-            except Exception as e:
-                pass
+        if violation.xref is not None:
+            rects.extend(self._get_xref_rects(page).get(violation.xref, ()))
 
         # 2. If no XREF or XREF found nothing, try Context Text Search
         # Many VeraPDF contexts look like: .../contentItem[0](Some Text)
         if not rects and violation.context:
-            import re
             # Look for content in parenthesis, e.g. " (Hello World) "
             # This is heuristic and might match wrong text, but better than nothing for visualization
-            text_matches = re.findall(r'\((.*?)\)', violation.context)
-            if text_matches:
-                # Use the longest match that looks like content
-                # Filter out short coding stuff like (1) or (r)
-                candidates = [t for t in text_matches if len(t) > 3]
-                if candidates:
-                    # Search for the longest candidate
-                    target_text = max(candidates, key=len)
+            # Use the longest match that looks like content
+            # (short coding stuff like (1) or (r) never matches)
+            target_text = ""
+            for match in CONTEXT_TEXT_RE.finditer(violation.context):
+                if len(match.group(1)) > len(target_text):
+                    target_text = match.group(1)
+            if target_text:
+                # Violations repeating the same context text share one search
+                search_key = (page.number, target_text)
+                search_res = self._search_cache.get(search_key)
+                if search_res is None:
                     try:
                         # hit_max=1 to just find the first instance? Or all?
                         # All instances might clutter, but if it's the same error repeated...
                         # Let's limit to 5
-                        search_res = page.search_for(target_text, hit_max=5)
-                        rects.extend(search_res)
+                        search_res = self._search_words(page, target_text, SEARCH_HIT_MAX)
+                        if not search_res:
+                            # Text that does not align with word boundaries
+                            search_res = page.search_for(target_text, hit_max=SEARCH_HIT_MAX)
                     except:
-                        pass
+                        search_res = []
+                    self._search_cache[search_key] = search_res
+                rects.extend(search_res)
         
         return rects
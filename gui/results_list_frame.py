@@ -0,0 +1,178 @@
+"""
+Virtualized scan results list
+"""
+import customtkinter as ctk
+from functools import partial
+from typing import Callable, List, Optional
+
+from gui.virtual_list_frame import VirtualListFrame
+from models.scan_result import PDFResult
+
+ROW_HEIGHT = 64  # Height of one row slot in pixels, including padding
+ROW_PADY = 5
+
+# Fonts shared by every row
+FONT_STATUS = ("Segoe UI", 20, "bold")
+FONT_FILENAME = ("Segoe UI", 13, "bold")
+FONT_DETAIL = ("Segoe UI", 11)
+
+
+class ResultRow:
+    """
+    Reusable widgets for one visible result row.
+    Rows never hold a PDFResult; button commands identify the row by its pool slot.
+    """
+
+    def __init__(self, master, slot: int, on_view_slot: Callable[[int], None], on_inspect_slot: Callable[[int], None]):
+        self.bound_key = None  # (generation, index) currently displayed
+        self._compliant: Optional[bool] = None  # Variant currently shown
+
+        self.frame = ctk.CTkFrame(master, fg_color=("white", "gray20"), height=ROW_HEIGHT - 2 * ROW_PADY)
+        self.frame.grid_propagate(False)
+        self.frame.grid_columnconfigure(1, weight=1)
+        self.frame.grid_rowconfigure((0, 1), weight=1)
+
+        # Status Icon/Label
+        self.status_lbl = ctk.CTkLabel(
+            self.frame,
+            text="",
+            font=FONT_STATUS,
+            width=40
+        )
+        self.status_lbl.grid(row=0, column=0, rowspan=2, padx=(10, 5))
+
+        # Filename and Violation count
+        self.name_lbl = ctk.CTkLabel(
+            self.frame,
+            text="",
+            font=FONT_FILENAME,
+            anchor="w"
+        )
+        self.name_lbl.grid(row=0, column=1, sticky="sew", padx=10)
+
+        self.detail_lbl = ctk.CTkLabel(
+            self.frame,
+            text="",
+            font=FONT_DETAIL,
+            text_color="gray",
+            anchor="w"
+        )
+        self.detail_lbl.grid(row=1, column=1, sticky="new", padx=10)
+
+        # Action Buttons
+        self.btn_view = ctk.CTkButton(
+            self.frame,
+            text="👁 View Annotations",
+            command=partial(on_view_slot, slot),
+            width=140,
+            height=32,
+            fg_color="orange",
+            hover_color="darkorange"
+        )
+        self.btn_view.grid(row=0, column=2, rowspan=2, padx=5, pady=10)
+        self.btn_view.grid_remove()  # Only shown for non-compliant results with violations
+
+        self.btn_inspect = ctk.CTkButton(
+            self.frame,
+            text="🔍 Inspect In-App",
+            command=partial(on_inspect_slot, slot),
+            width=140,
+            height=32,
+            fg_color="#00695c",
+            hover_color="#004d40"
+        )
+        self.btn_inspect.grid(row=0, column=3, rowspan=2, padx=(5, 15), pady=10)
+
+    def bind(self, result: PDFResult):
+        """Show a result in this row, reusing the existing widgets"""
+        self.name_lbl.configure(text=result.filename)
+
+        if result.compliant:
+            self._bind_compliant(result)
+        else:
+            self._bind_non_compliant(result)
+
+    def _bind_compliant(self, result: PDFResult):
+        """Compliant variant: check mark and no annotation button"""
+        if self._compliant is not True:
+            self.status_lbl.configure(text="✓", text_color="green")
+            self.btn_view.grid_remove()
+            self._compliant = True
+        self.detail_lbl.configure(text=f"Error: {result.error}" if result.error else "Full Compliance")
+
+    def _bind_non_compliant(self, result: PDFResult):
+        """Non-compliant variant: cross and, when there are violations, the annotation button"""
+        if self._compliant is not False:
+            self.status_lbl.configure(text="✗", text_color="red")
+            self._compliant = False
+        self.detail_lbl.configure(
+            text=f"Error: {result.error}" if result.error else f"{result.total_violations} Violations"
+        )
+
+        if result.violations:
+            self.btn_view.grid()
+        else:
+            self.btn_view.grid_remove()
+
+
+class ResultsListFrame(VirtualListFrame):
+    """Scrollable list of scan results backed by a fixed pool of ResultRow widgets"""
+    def __init__(self, master, on_view: Callable, on_inspect: Callable, **kwargs):
+        super().__init__(master, ROW_HEIGHT, **kwargs)
+        self.on_view = on_view
+        self.on_inspect = on_inspect
+        self._generation = 0  # Bumped whenever the result list is replaced
+
+        self._refresh()
+
+    @property
+    def results(self) -> List[PDFResult]:
+        """Results currently in the list"""
+        return self.items
+
+    def set_results(self, results: List[PDFResult]):
+        """Replace the displayed results and scroll back to the top"""
+        self.items = list(results)
+        self.first_index = 0
+        self._generation += 1
+        self._refresh()
+
+    def extend_results(self, results: List[PDFResult]):
+        """Add results at the end of the list with a single refresh (used while a scan streams in)"""
+        self.items.extend(results)
+        self._refresh()
+
+    def clear(self):
+        """Remove all results"""
+        self.set_results([])
+
+    def _result_at_slot(self, slot: int) -> Optional[PDFResult]:
+        """Result currently shown in a pool slot"""
+        idx = self.first_index + slot
+        return self.items[idx] if idx < len(self.items) else None
+
+    def _on_view_slot(self, slot: int):
+        result = self._result_at_slot(slot)
+        if result is not None:
+            self.on_view(result)
+
+    def _on_inspect_slot(self, slot: int):
+        result = self._result_at_slot(slot)
+        if result is not None:
+            self.on_inspect(result)
+
+    def _create_row(self, slot: int) -> ResultRow:
+        row = ResultRow(self.viewport, slot, self._on_view_slot, self._on_inspect_slot)
+        row.frame.grid(row=slot, column=0, sticky="ew", padx=10, pady=ROW_PADY)
+        return row
+
+    def _show_row(self, slot: int, row: ResultRow, index: int):
+        key = (self._generation, index)
+        if row.bound_key != key:
+            row.bind(self.items[index])
+            row.bound_key = key
+        row.frame.grid()
+
+    def _hide_row(self, slot: int, row: ResultRow):
+        row.bound_key = None
+        row.frame.grid_remove()
@@ -0,0 +1,69 @@
+"""
+Virtualized indented list for the inspector sidebars
+"""
+import customtkinter as ctk
+from functools import partial
+from typing import Any, Callable, List, NamedTuple, Optional
+
+from gui.virtual_list_frame import VirtualListFrame
+
+ROW_HEIGHT = 24  # Height of one row slot in pixels
+INDENT = 15  # Pixels of indentation per tree level
+
+FONT_ROW = ("Segoe UI", 11, "bold")
+DEFAULT_COLOR = ("gray10", "gray90")
+
+
+class TreeItem(NamedTuple):
+    """One row of a flattened tree"""
+    text: str
+    level: int = 0
+    color: Any = DEFAULT_COLOR
+    command: Optional[Callable[[], None]] = None  # None for non-clickable hint rows
+    fill: Any = "transparent"  # Row background
+
+
+class TreeListFrame(VirtualListFrame):
+    """Scrollable list of flattened tree items backed by a fixed pool of labels"""
+    def __init__(self, master, label_text: str = "", **kwargs):
+        super().__init__(master, ROW_HEIGHT, grid_row=1, **kwargs)
+        self._row_levels: List[int] = []
+
+        if label_text:
+            ctk.CTkLabel(self, text=label_text).grid(row=0, column=0, columnspan=2, sticky="ew", pady=(2, 0))
+
+    def set_items(self, items: List[TreeItem], keep_position: bool = False):
+        """Replace the displayed items and scroll back to the top, unless keep_position is set"""
+        self.items = items
+        if not keep_position:
+            self.first_index = 0
+        max_first = max(0, len(self.items) - self._visible_count())
+        self.first_index = min(self.first_index, max_first)
+        self._refresh()
+
+    def clear(self):
+        """Remove all items"""
+        self.set_items([])
+
+    def _on_row_click(self, slot: int, event=None):
+        idx = self.first_index + slot
+        if idx < len(self.items) and self.items[idx].command is not None:
+            self.items[idx].command()
+
+    def _create_row(self, slot: int) -> ctk.CTkLabel:
+        row = ctk.CTkLabel(self.viewport, text="", font=FONT_ROW, anchor="w", height=ROW_HEIGHT)
+        row.grid(row=slot, column=0, sticky="ew", padx=(0, 2))
+        row.bind("<Button-1>", partial(self._on_row_click, slot))
+        self._row_levels.append(0)
+        return row
+
+    def _show_row(self, slot: int, row: ctk.CTkLabel, index: int):
+        item = self.items[index]
+        row.configure(text=item.text, text_color=item.color, fg_color=item.fill)
+        if self._row_levels[slot] != item.level:
+            row.grid_configure(padx=(item.level * INDENT, 2))
+            self._row_levels[slot] = item.level
+        row.grid()
+
+    def _hide_row(self, slot: int, row: ctk.CTkLabel):
+        row.grid_remove()
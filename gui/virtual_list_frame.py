@@ -0,0 +1,112 @@
+"""
+Base class for virtualized lists
+Only the rows that fit in the viewport exist as widgets; they are rebound to
+different items as the user scrolls.
+"""
+import customtkinter as ctk
+import math
+from typing import Any, List
+
+WHEEL_STEP = 3  # Rows scrolled per mouse wheel notch
+
+
+class VirtualListFrame(ctk.CTkFrame):
+    """
+    Scrollable list of items backed by a fixed pool of row widgets.
+    Memory and redraw cost depend on the viewport height, not the item count.
+    Subclasses create, show and hide the pooled rows; this class owns the
+    pool, the viewport and scrolling.
+    """
+    def __init__(self, master, row_height: int, grid_row: int = 0, **kwargs):
+        super().__init__(master, **kwargs)
+        self.row_height = row_height  # Unscaled height of one row slot
+        self.items: List[Any] = []
+        self.first_index = 0
+        self._rows: List[Any] = []
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(grid_row, weight=1)
+
+        self.viewport = ctk.CTkFrame(self, fg_color="transparent")
+        self.viewport.grid(row=grid_row, column=0, sticky="nsew")
+        self.viewport.grid_columnconfigure(0, weight=1)
+        self.viewport.grid_propagate(False)  # Size comes from the parent, not the rows
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.grid(row=grid_row, column=1, sticky="ns")
+
+        self.viewport.bind("<Configure>", lambda e: self._refresh())
+        self.bind_all("<MouseWheel>", self._on_mousewheel, add="+")
+        self.bind_all("<Button-4>", self._on_mousewheel, add="+")
+        self.bind_all("<Button-5>", self._on_mousewheel, add="+")
+
+    def _create_row(self, slot: int) -> Any:
+        """Create and grid the pooled row for a slot"""
+        raise NotImplementedError
+
+    def _show_row(self, slot: int, row: Any, index: int):
+        """Display items[index] in a pooled row"""
+        raise NotImplementedError
+
+    def _hide_row(self, slot: int, row: Any):
+        """Hide a pooled row that has no item to display"""
+        raise NotImplementedError
+
+    def _visible_count(self) -> int:
+        """Number of row slots that fit in the viewport"""
+        return max(1, self.viewport.winfo_height() // self._slot_height())
+
+    def _slot_height(self) -> int:
+        """Height of one row slot in screen pixels; CTk scales row heights and padding on HiDPI displays"""
+        return math.ceil(self.row_height * self._get_widget_scaling())
+
+    def _scroll_to(self, index: int):
+        """Scroll so that items[index] is the first visible row"""
+        max_first = max(0, len(self.items) - self._visible_count())
+        index = max(0, min(index, max_first))
+        if index != self.first_index:
+            self.first_index = index
+            self._refresh()
+
+    def _on_scrollbar(self, *args):
+        """Handle scrollbar drags ('moveto') and arrow/trough clicks ('scroll')"""
+        if args[0] == "moveto":
+            self._scroll_to(int(float(args[1]) * len(self.items)))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= self._visible_count()
+            self._scroll_to(self.first_index + step)
+
+    def _on_mousewheel(self, event):
+        """Scroll when the wheel is used over this list"""
+        if not str(event.widget).startswith(str(self)):
+            return
+        if event.num == 4:
+            direction = -1
+        elif event.num == 5:
+            direction = 1
+        else:
+            direction = -1 if event.delta > 0 else 1
+        self._scroll_to(self.first_index + direction * WHEEL_STEP)
+
+    def _refresh(self):
+        """Bind the visible slice of items to the row pool"""
+        count = self._visible_count()
+
+        # Grow the pool when the viewport gets taller
+        while len(self._rows) < count:
+            self._rows.append(self._create_row(len(self._rows)))
+
+        for slot, row in enumerate(self._rows):
+            idx = self.first_index + slot
+            if slot < count and idx < len(self.items):
+                self._show_row(slot, row, idx)
+            else:
+                self._hide_row(slot, row)
+
+        total = len(self.items)
+        if total:
+            self.scrollbar.set(self.first_index / total, min(1.0, (self.first_index + count) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
@@ -2,7 +2,6 @@
 Main desktop application entry point
 PDF Compliance Scanner - Windows Desktop Application
 """
-import customtkinter as ctk
 from tkinter import messagebox
 import sys
 from pathlib import Path
@@ -12,8 +11,8 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from utils.logger import setup_logger, log_separator
 from services.java_checker import verify_java_version, get_java_install_instructions
-from utils.verapdf_wrapper import find_verapdf_executable
-from gui.main_window import MainWindow
+from utils.verapdf_wrapper import find_verapdf_executable, set_verapdf_executable
+from services import env_cache
 import config
 
 logger = setup_logger(__name__)
@@ -28,6 +27,13 @@ def check_dependencies() -> bool:
     """
     log_separator(logger, "Checking Dependencies")
     
+    # Trust the last known-good environment; MainWindow re-checks it in background
+    cached_env = env_cache.load()
+    if env_cache.is_usable(cached_env):
+        logger.info(f"Using cached environment: veraPDF {cached_env.verapdf_version}, Java {cached_env.java_version}")
+        set_verapdf_executable(cached_env.verapdf_path)
+        return True
+    
     # Check Java
     logger.info("Checking Java installation...")
     if not verify_java_version(config.MIN_JAVA_VERSION):
@@ -65,17 +71,21 @@ def main():
     logger.info(f"Working directory: {Path.cwd()}")
     
     try:
+        # Check dependencies before importing the GUI stack (customtkinter, PyMuPDF,
+        # Pillow), so a missing Java/veraPDF is reported without waiting on those imports
+        if not check_dependencies():
+            logger.error("Dependency check failed. Exiting.")
+            return 1
+        
+        import customtkinter as ctk
+        from gui.main_window import MainWindow
+        
         # Set appearance mode and theme
         ctk.set_appearance_mode(config.THEME_MODE)
         ctk.set_default_color_theme(config.COLOR_THEME)
         
         logger.info(f"UI Theme: {config.THEME_MODE}/{config.COLOR_THEME}")
         
-        # Check dependencies
-        if not check_dependencies():
-            logger.error("Dependency check failed. Exiting.")
-            return 1
-        
         # Create and run main window
         logger.info("Creating main window...")
         app = MainWindow()
@@ -2,12 +2,18 @@
 Data models for PDF scan results
 """
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 import json
+import sys
+import time
 
+# Slotted instances drop the per-object __dict__ (tens of thousands of violations
+# per scan); dataclass(slots=True) needs Python 3.10, older versions keep __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class RuleViolation:
     """Represents a single compliance rule violation"""
     rule_id: str
@@ -19,6 +25,15 @@ class RuleViolation:
     object_id: Optional[str] = None
     page: Optional[int] = None
     context: Optional[str] = None
+    # Object number parsed from object_id ("12 0 obj" -> 12), None if there is none
+    xref: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if self.object_id:
+            try:
+                self.xref = int(self.object_id.split()[0])
+            except (ValueError, IndexError):
+                pass
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
@@ -50,7 +65,7 @@ class RuleViolation:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PDFResult:
     """Represents scan result for a single PDF"""
     filename: str
@@ -126,7 +141,7 @@ class PDFResult:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ScanJob:
     """Represents a complete scanning session"""
     job_id: str
@@ -134,10 +149,26 @@ class ScanJob:
     end_time: Optional[datetime] = None
     results: List[PDFResult] = field(default_factory=list)
     total_files: int = 0
+    # Monotonic clock readings for live jobs; wall-clock jumps do not skew durations
+    _start_clock: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _end_clock: Optional[float] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if not self.start_time:
             self.start_time = datetime.now()
+        self._start_clock = time.monotonic()
+    
+    def _status_counts(self) -> Tuple[int, int, int]:
+        """Count (compliant, non-compliant, error) results in one pass over the results"""
+        compliant = non_compliant = errors = 0
+        for r in self.results:
+            if r.error:
+                errors += 1
+            elif r.compliant:
+                compliant += 1
+            else:
+                non_compliant += 1
+        return compliant, non_compliant, errors
     
     @property
     def is_complete(self) -> bool:
@@ -147,24 +178,27 @@ class ScanJob:
     @property
     def duration_seconds(self) -> float:
         """Duration of scan in seconds"""
-        if not self.end_time:
-            return (datetime.now() - self.start_time).total_seconds()
-        return (self.end_time - self.start_time).total_seconds()
+        if self._start_clock is None or (self.end_time and self._end_clock is None):
+            # Loaded from disk (or finished without complete()): only wall-clock times are known
+            end_time = self.end_time or datetime.now()
+            return (end_time - self.start_time).total_seconds()
+        end_clock = self._end_clock if self._end_clock is not None else time.monotonic()
+        return end_clock - self._start_clock
     
     @property
     def compliant_count(self) -> int:
         """Number of compliant PDFs"""
-        return sum(1 for r in self.results if r.compliant and not r.error)
+        return self._status_counts()[0]
     
     @property
     def non_compliant_count(self) -> int:
         """Number of non-compliant PDFs"""
-        return sum(1 for r in self.results if not r.compliant and not r.error)
+        return self._status_counts()[1]
     
     @property
     def error_count(self) -> int:
         """Number of PDFs with errors"""
-        return sum(1 for r in self.results if r.error)
+        return self._status_counts()[2]
     
     @property
     def success_rate(self) -> float:
@@ -180,15 +214,15 @@ class ScanJob:
     def complete(self):
         """Mark the scan job as complete"""
         self.end_time = datetime.now()
+        self._end_clock = time.monotonic()
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization"""
+    def _summary_dict(self) -> Dict[str, Any]:
+        """Job-level fields of to_dict(), without the results"""
         return {
             'job_id': self.job_id,
             'start_time': self.start_time.isoformat(),
             'end_time': self.end_time.isoformat() if self.end_time else None,
             'total_files': self.total_files,
-            'results': [r.to_dict() for r in self.results],
             'compliant_count': self.compliant_count,
             'non_compliant_count': self.non_compliant_count,
             'error_count': self.error_count,
@@ -197,10 +231,27 @@ class ScanJob:
             'is_complete': self.is_complete,
         }
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        data = self._summary_dict()
+        data['results'] = [r.to_dict() for r in self.results]
+        return data
+    
     def to_json(self, filepath: str):
-        """Save scan job to JSON file"""
+        """
+        Save scan job to JSON file.
+        Results are encoded one at a time, so the whole job is never held as one nested dict.
+        """
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, indent=2)
+            f.write('{\n')
+            for key, value in self._summary_dict().items():
+                f.write(f'  {json.dumps(key)}: {json.dumps(value)},\n')
+            f.write('  "results": [')
+            for i, result in enumerate(self.results):
+                f.write(',\n    ' if i else '\n    ')
+                # Strings escape their newlines, so every raw newline is layout
+                f.write(json.dumps(result.to_dict(), indent=2).replace('\n', '\n    '))
+            f.write('\n  ]\n}' if self.results else ']\n}')
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ScanJob':
@@ -215,13 +266,15 @@ class ScanJob:
         if data.get('end_time'):
             end_time = datetime.fromisoformat(data['end_time'])
         
-        return cls(
+        job = cls(
             job_id=data.get('job_id', ''),
             start_time=start_time,
             end_time=end_time,
             results=results,
             total_files=data.get('total_files', 0),
         )
+        job._start_clock = None  # Not started in this process
+        return job
     
     @classmethod
     def from_json(cls, filepath: str) -> 'ScanJob':
@@ -0,0 +1,90 @@
+"""
+Environment cache for PDF Compliance Scanner
+Remembers the resolved veraPDF executable, its version and the Java version so
+startup can trust the last known-good environment and re-check it in background
+"""
+import json
+from typing import NamedTuple, Optional
+
+from utils.logger import setup_logger
+from utils.verapdf_wrapper import find_verapdf_executable, get_verapdf_version
+from services.java_checker import check_java_installation
+import config
+
+logger = setup_logger(__name__)
+
+
+class CachedEnvironment(NamedTuple):
+    """Last known veraPDF/Java environment"""
+    verapdf_path: Optional[str] = None
+    verapdf_version: Optional[str] = None
+    java_version: Optional[int] = None
+
+
+def load() -> CachedEnvironment:
+    """
+    Load the cached environment.
+    
+    Returns:
+        CachedEnvironment, with all fields None if there is no usable cache
+    """
+    try:
+        with open(config.ENV_CACHE_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        env = CachedEnvironment(
+            verapdf_path=data.get('verapdf_path'),
+            verapdf_version=data.get('verapdf_version'),
+            java_version=data.get('java_version'),
+        )
+        logger.debug(f"Loaded cached environment: {env}")
+        return env
+    except FileNotFoundError:
+        return CachedEnvironment()
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable environment cache: {e}")
+        return CachedEnvironment()
+
+
+def save(env: CachedEnvironment):
+    """Write the environment cache"""
+    try:
+        config.ENV_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(config.ENV_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(env._asdict(), f, indent=2)
+    except Exception as e:
+        logger.error(f"Failed to save environment cache: {e}")
+
+
+def probe() -> CachedEnvironment:
+    """
+    Probe the current environment (runs java and veraPDF subprocesses).
+    
+    Returns:
+        Freshly detected CachedEnvironment
+    """
+    _, _, java_version = check_java_installation()
+    verapdf_path = find_verapdf_executable(refresh=True)
+    verapdf_version = get_verapdf_version(verapdf_path) if verapdf_path else None
+    
+    return CachedEnvironment(
+        verapdf_path=verapdf_path,
+        verapdf_version=verapdf_version,
+        java_version=java_version,
+    )
+
+
+def is_usable(env: CachedEnvironment) -> bool:
+    """Whether an environment has veraPDF and a new enough Java"""
+    return bool(env.verapdf_path) and (env.java_version or 0) >= config.MIN_JAVA_VERSION
+
+
+def revalidate() -> CachedEnvironment:
+    """
+    Probe the environment and refresh the cache.
+    
+    Returns:
+        Freshly detected CachedEnvironment
+    """
+    env = probe()
+    save(env)
+    return env
@@ -9,15 +9,39 @@ from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Version in `java -version` output. Format varies: "1.8.0_292", "11.0.12", "17.0.1"
+VERSION_RE = re.compile(r'"?(\d+\.?\d*\.?\d*[._]\d+)"?')
+# Alternate format (Java 9+), e.g. version "21"
+VERSION_RE_ALT = re.compile(r'version "(\d+)')
 
-def check_java_installation() -> Tuple[bool, Optional[str], Optional[int]]:
+# Result of the last successful Java check, reused for the rest of the process
+_java_check: Optional[Tuple[bool, Optional[str], Optional[int]]] = None
+
+
+def check_java_installation(refresh: bool = False) -> Tuple[bool, Optional[str], Optional[int]]:
     """
     Check if Java is installed and meets minimum version requirement.
+    A successful result is cached, so later calls do not start another JVM.
+    
+    Args:
+        refresh: Ignore the cached result and run java -version again
     
     Returns:
         Tuple of (is_installed, version_string, major_version)
         Example: (True, "1.8.0_292", 8)
     """
+    global _java_check
+    if _java_check and not refresh:
+        return _java_check
+    
+    result = _run_java_check()
+    # Failures are not cached, so installing Java is picked up by the next check
+    _java_check = result if result[0] else None
+    return result
+
+
+def _run_java_check() -> Tuple[bool, Optional[str], Optional[int]]:
+    """Run java -version and parse the installed version"""
     logger.info("Checking for Java installation...")
     
     try:
@@ -35,12 +59,7 @@ def check_java_installation() -> Tuple[bool, Optional[str], Optional[int]]:
         logger.debug(f"Java command output: {output}")
         
         # Parse version string
-        # Format varies: "1.8.0_292", "11.0.12", "17.0.1"
-        version_match = re.search(r'"?(\d+\.?\d*\.?\d*[._]\d+)"?', output)
-        
-        if not version_match:
-            # Try alternate format (Java 9+)
-            version_match = re.search(r'version "(\d+)', output)
+        version_match = VERSION_RE.search(output) or VERSION_RE_ALT.search(output)
         
         if not version_match:
             logger.warning("Could not parse Java version from output")
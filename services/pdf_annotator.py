@@ -4,9 +4,11 @@ Highlights accessibility errors in PDF files using PyMuPDF
 """
 import fitz  # PyMuPDF
 from pathlib import Path
-from typing import List, Optional
+import shutil
+from typing import Dict, List, Optional, Tuple
 import logging
 from models.scan_result import RuleViolation
+from utils.pdf_utils import map_xrefs_to_rects
 
 logger = logging.getLogger(__name__)
 
@@ -26,16 +28,23 @@ class PDFAnnotator:
             Path to annotated PDF
         """
         try:
-            doc = fitz.open(input_path)
-            
             if not output_path:
                 p = Path(input_path)
                 output_path = str(p.parent / f"{p.stem}_annotated{p.suffix}")
             
+            if not violations:
+                # Nothing to draw; a byte copy avoids re-serializing the whole PDF
+                shutil.copyfile(input_path, output_path)
+                logger.info(f"No violations to annotate, copied PDF: {output_path}")
+                return output_path
+            
+            doc = fitz.open(input_path)
+            page_count = doc.page_count
+            
             logger.info(f"Annotating PDF: {input_path}")
             logger.info(f"Violations to process: {len(violations)}")
             
-            # Key: (page_idx, unique_rect_str) -> count
+            # Marked areas: (page_idx, x0, y0, x1, y1) for rects, (page_idx, "text", y) for notes
             highlighted_areas = set()
             
             # Collection for document-level errors (metadata, etc.)
@@ -44,6 +53,14 @@ class PDFAnnotator:
             # Reserved height on first page for global errors
             first_page_start_y = 50
             
+            # Marks are collected per page and drawn with one Shape per page,
+            # instead of a separate content stream edit for every rect and note
+            color = (1, 0, 0) # Red
+            rects_by_page: Dict[int, List[fitz.Rect]] = {}
+            notes_by_page: Dict[int, List[Tuple[fitz.Point, str]]] = {}
+            # page_idx -> {xref: rects}, built once per page that has object violations
+            xref_rects_by_page: Dict[int, Dict[int, List[fitz.Rect]]] = {}
+            
             for v in violations:
                 page_idx = -1
                 rects = []
@@ -70,33 +87,19 @@ class PDFAnnotator:
                     continue
                 
                 # If page is invalid, skip
-                if page_idx < 0 or page_idx >= len(doc):
+                if page_idx < 0 or page_idx >= page_count:
                     continue
                     
                 page = doc[page_idx]
                 
                 # 2. Try to find the object's visual location
                 # A. XREF based lookup
-                if v.object_id:
-                    try:
-                        xref = int(v.object_id.split()[0])
-                        
-                        # Images
-                        images = page.get_images(full=True)
-                        for img in images:
-                            if img[0] == xref:
-                                rects.extend(page.get_image_rects(xref))
-                        
-                        # Annotations & Widgets
-                        for ann in page.anns:
-                            if ann.xref == xref:
-                                rects.append(ann.rect)
-                        for widget in page.widgets():
-                            if widget.xref == xref:
-                                rects.append(widget.rect)
-                                
-                    except Exception as e:
-                        logger.debug(f"Error parsing object ID {v.object_id}: {e}")
+                if v.xref is not None:
+                    # Images, Annotations & Widgets
+                    xref_rects = xref_rects_by_page.get(page_idx)
+                    if xref_rects is None:
+                        xref_rects = xref_rects_by_page[page_idx] = map_xrefs_to_rects(page)
+                    rects.extend(xref_rects.get(v.xref, ()))
 
                 # B. Text Search Fallback
                 if not rects and v.context:
@@ -112,15 +115,13 @@ class PDFAnnotator:
                             except:
                                 pass
 
-                # 3. Draw Annotations on specific page
-                color = (1, 0, 0) # Red
-                
+                # 3. Queue annotations for the specific page
                 if rects:
                     # Highlight specific objects
                     for r in rects:
-                        r_key = f"{page_idx}_{r}"
+                        r_key = (page_idx, round(r.x0, 1), round(r.y0, 1), round(r.x1, 1), round(r.y1, 1))
                         if r_key not in highlighted_areas:
-                            page.draw_rect(r, color=color, width=2)
+                            rects_by_page.setdefault(page_idx, []).append(r)
                             highlighted_areas.add(r_key)
                 else:
                     # Fallback: Page level annotation (e.g. content error but not an image)
@@ -138,17 +139,27 @@ class PDFAnnotator:
                             break
                         
                         point = fitz.Point(30, y_pos)
-                        r_key = f"{page_idx}_text_{y_pos}"
+                        r_key = (page_idx, "text", y_pos)
                         
                         if r_key not in highlighted_areas:
                             text = f"[{v.rule_id}] {v.description[:60]}..."
-                            page.insert_text(point, text, color=color, fontsize=8)
+                            notes_by_page.setdefault(page_idx, []).append((point, text))
                             highlighted_areas.add(r_key)
                             slot_found = True
                             break
                             
+            # Draw the queued marks, one content stream update per page
+            for page_idx in sorted(rects_by_page.keys() | notes_by_page.keys()):
+                shape = doc[page_idx].new_shape()
+                for r in rects_by_page.get(page_idx, ()):
+                    shape.draw_rect(r)
+                shape.finish(color=color, width=2)
+                for point, text in notes_by_page.get(page_idx, ()):
+                    shape.insert_text(point, text, color=color, fontsize=8)
+                shape.commit()
+            
             # 4. Print Global Errors on Page 1 (Index 0)
-            if global_errors and len(doc) > 0:
+            if global_errors and page_count > 0:
                 page = doc[0]
                 
                 # Draw Header Box
@@ -2,15 +2,22 @@
 PDF scanner service with logging
 Handles directory scanning and batch processing of PDFs
 """
+import os
 from pathlib import Path
-from typing import List, Callable, Optional
+from typing import List, Callable, Optional, Dict, Any, Tuple
+from collections import OrderedDict
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 from utils.logger import setup_logger, log_separator
-from utils.verapdf_wrapper import validate_pdf
-from utils.pdf_utils import build_xref_page_map, resolve_violation_page, get_logical_structure
+from utils.verapdf_wrapper import (
+    validate_pdf, validate_pdf_batch, terminate_running_validations,
+    VeraPDFNotFoundError, ValidationError
+)
 from models.scan_result import ScanJob, PDFResult, RuleViolation
+from services.scan_cache import ScanCache, sha256_file
 import config
 
 logger = setup_logger(__name__)
@@ -19,20 +26,32 @@ logger = setup_logger(__name__)
 class PDFScanner:
     """Main PDF scanning service"""
     
-    def __init__(self):
+    def __init__(self, cache: Optional[ScanCache] = None):
         self.current_job: Optional[ScanJob] = None
+        self.cache = cache
+        self._stop_requested = threading.Event()
+        config.ensure_dirs()  # Job results are saved to REPORTS_FOLDER
     
     def scan_files(
         self,
         pdf_files: List[str],
-        progress_callback: Optional[Callable[[int, int, str], None]] = None
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        result_callback: Optional[Callable[[PDFResult], None]] = None,
+        max_workers: Optional[int] = None
     ) -> ScanJob:
         """
         Scan a list of PDF files for compliance.
         
+        Callbacks are always invoked on the calling thread, even when several
+        veraPDF batches run at once.
+        
         Args:
             pdf_files: List of PDF file paths
             progress_callback: Optional callback(current, total, filename)
+            result_callback: Optional callback(result) fired as each file completes,
+                in completion order (cached files first)
+            max_workers: Number of veraPDF batches run concurrently
+                (defaults to config.PARALLEL_PROCESSES)
             
         Returns:
             ScanJob with all results
@@ -50,62 +69,82 @@ class PDFScanner:
         )
         self.current_job = job
         
-        # Scan each PDF
-        for idx, pdf_path in enumerate(pdf_files, 1):
-            pdf_file = Path(pdf_path)
-            logger.info(f"Scanning {idx}/{len(pdf_files)}: {pdf_file.name}")
+        total = len(pdf_files)
+        self._stop_requested.clear()
+        # Use one cache for the whole scan even if self.cache is swapped meanwhile
+        cache = self.cache
+        
+        # Hash all files up front; hashlib releases the GIL so this runs in parallel
+        file_hashes = self._hash_files(pdf_files) if cache is not None else [None] * total
+        
+        results: List[Optional[PDFResult]] = [None] * total
+        completed = 0
+        
+        # Reuse previous results for files whose content is unchanged
+        pending = []
+        for idx, pdf_path in enumerate(pdf_files):
+            file_hash = file_hashes[idx]
+            cached_result = cache.get(file_hash, pdf_path) if file_hash is not None else None
             
-            if progress_callback:
-                progress_callback(idx, len(pdf_files), pdf_file.name)
+            if cached_result is None:
+                pending.append(idx)
+                continue
             
-            try:
-                # Validate PDF
-                validation_result = validate_pdf(str(pdf_file))
-                
-                # Extract Structure manually (More reliable than VeraPDF CLI in some versions)
-                import fitz
-                doc_temp = fitz.open(str(pdf_file))
-                structure_tree = get_logical_structure(doc_temp)
-                doc_temp.close()
-                
-                # Convert to PDFResult
-                violations = [
-                    RuleViolation.from_dict(v)
-                    for v in validation_result.get('violations', [])
-                ]
+            results[idx] = cached_result
+            completed += 1
+            logger.info(f"✓ Cached: {cached_result.filename} - {cached_result.status}")
+            if result_callback:
+                result_callback(cached_result)
+            if progress_callback:
+                progress_callback(completed, total, cached_result.filename)
+        
+        # Validate the rest in batches so one veraPDF JVM serves many files.
+        # Each batch is a separate process, so threads are enough to run them in parallel.
+        workers = max(1, max_workers or config.PARALLEL_PROCESSES)
+        # Shrink batches when there are too few files to keep every worker busy
+        batch_size = max(1, min(config.VERAPDF_BATCH_SIZE, -(-len(pending) // workers)))
+        batches = [pending[start:start + batch_size] for start in range(0, len(pending), batch_size)]
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._validate_batch, [pdf_files[idx] for idx in batch]): batch
+                for batch in batches
+            }
+            for future in as_completed(futures):
+                if self._stop_requested.is_set():
+                    logger.warning("Scan stopped before completion")
+                    for other in futures:
+                        other.cancel()
+                    break
                 
-                result = PDFResult(
-                    filename=pdf_file.name,
-                    filepath=str(pdf_file),
-                    compliant=validation_result.get('compliant', False),
-                    profile=validation_result.get('profile', 'Unknown'),
-                    statement=validation_result.get('statement', ''),
-                    violations=violations,
-                    structure_tree=structure_tree,
-                    error=validation_result.get('error'),
-                    scan_time=datetime.now()
-                )
+                batch = futures[future]
+                validation_results = future.result()
                 
+                for idx in batch:
+                    pdf_path = pdf_files[idx]
+                    result = self._build_result(pdf_path, validation_results[pdf_path])
+                    results[idx] = result
+                    completed += 1
+                    
+                    if file_hashes[idx] is not None:
+                        cache.put(file_hashes[idx], result)
+                    
+                    if result_callback:
+                        result_callback(result)
+                    
+                    if progress_callback:
+                        progress_callback(completed, total, result.filename)
+        
+        for result in results:
+            if result is not None:
                 job.add_result(result)
-                logger.info(f"✓ Completed: {pdf_file.name} - {result.status}")
-                
-            except Exception as e:
-                logger.error(f"✗ Failed to scan {pdf_file.name}: {e}")
-                
-                # Add error result
-                error_result = PDFResult(
-                    filename=pdf_file.name,
-                    filepath=str(pdf_file),
-                    compliant=False,
-                    profile='Error',
-                    error=str(e),
-                    scan_time=datetime.now()
-                )
-                job.add_result(error_result)
         
         # Complete the job
         job.complete()
         
+        if cache is not None:
+            cache.save()
+        
         log_separator(logger, f"Scan Job Complete: {job_id}")
         logger.info(f"Duration: {job.duration_seconds:.2f} seconds")
         logger.info(f"Total files: {job.total_files}")
@@ -120,6 +159,128 @@ class PDFScanner:
         self.current_job = None
         return job
     
+    def _validate_batch(self, pdf_paths: List[str]) -> Dict[str, Any]:
+        """
+        Validate a batch of PDFs with one veraPDF run.
+        If the batch run fails as a whole, fall back to validating each file
+        on its own so a single bad file cannot fail its neighbours.
+        
+        Args:
+            pdf_paths: List of PDF file paths
+            
+        Returns:
+            Mapping of path to validation result dict, or to the exception raised
+        """
+        # Queued batches may start after stop() killed the running ones
+        if self._stop_requested.is_set():
+            return {pdf_path: ValidationError("Scan stopped") for pdf_path in pdf_paths}
+        
+        if len(pdf_paths) > 1:
+            try:
+                return validate_pdf_batch(pdf_paths)
+            except VeraPDFNotFoundError as e:
+                # Retrying file by file would fail the same way; every file gets the error
+                return {pdf_path: e for pdf_path in pdf_paths}
+            except Exception as e:
+                logger.warning(f"Batch validation failed, validating files individually: {e}")
+        
+        validation_results = {}
+        for pdf_path in pdf_paths:
+            if self._stop_requested.is_set():
+                validation_results[pdf_path] = ValidationError("Scan stopped")
+                continue
+            try:
+                validation_results[pdf_path] = validate_pdf(pdf_path)
+            except Exception as e:
+                validation_results[pdf_path] = e
+        return validation_results
+    
+    def _build_result(self, pdf_path: str, validation_result: Any) -> PDFResult:
+        """
+        Convert a veraPDF validation result into a PDFResult.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            validation_result: Parsed validation dict, or the exception raised
+            
+        Returns:
+            PDFResult (with error set if validation or parsing failed)
+        """
+        filename = os.path.basename(pdf_path)
+        
+        try:
+            if isinstance(validation_result, Exception):
+                raise validation_result
+            
+            # Extract Structure manually (More reliable than VeraPDF CLI in some versions)
+            import fitz
+            from utils.pdf_utils import get_logical_structure
+            doc_temp = fitz.open(pdf_path)
+            structure_tree = get_logical_structure(doc_temp)
+            doc_temp.close()
+            
+            # Convert to PDFResult
+            violations = [
+                RuleViolation.from_dict(v)
+                for v in validation_result.get('violations', [])
+            ]
+            
+            result = PDFResult(
+                filename=filename,
+                filepath=pdf_path,
+                compliant=validation_result.get('compliant', False),
+                profile=validation_result.get('profile', 'Unknown'),
+                statement=validation_result.get('statement', ''),
+                violations=violations,
+                structure_tree=structure_tree,
+                error=validation_result.get('error'),
+                scan_time=datetime.now()
+            )
+            
+            logger.info(f"✓ Completed: {filename} - {result.status}")
+            return result
+            
+        except Exception as e:
+            logger.error(f"✗ Failed to scan {filename}: {e}")
+            
+            # Error result
+            return PDFResult(
+                filename=filename,
+                filepath=pdf_path,
+                compliant=False,
+                profile='Error',
+                error=str(e),
+                scan_time=datetime.now()
+            )
+    
+    def stop(self):
+        """
+        Stop the running scan: no further batches are started and
+        any veraPDF process still running is killed.
+        """
+        self._stop_requested.set()
+        terminate_running_validations()
+    
+    def _hash_files(self, pdf_files: List[str]) -> List[Optional[str]]:
+        """
+        Compute SHA-256 hashes for the scan cache using a thread pool.
+        
+        Args:
+            pdf_files: List of PDF file paths
+            
+        Returns:
+            Hashes in input order; None for files that could not be read
+        """
+        def hash_or_none(pdf_path: str) -> Optional[str]:
+            try:
+                return sha256_file(pdf_path)
+            except OSError as e:
+                logger.warning(f"Could not hash {pdf_path}: {e}")
+                return None
+        
+        with ThreadPoolExecutor(max_workers=config.PARALLEL_PROCESSES) as executor:
+            return list(executor.map(hash_or_none, pdf_files))
+    
     def scan_directory(
         self,
         directory: str,
@@ -137,20 +298,11 @@ class PDFScanner:
         Returns:
             ScanJob with all results
         """
-        dir_path = Path(directory)
-        
-        logger.info(f"Scanning directory: {dir_path}")
+        logger.info(f"Scanning directory: {directory}")
         logger.info(f"Recursive: {recursive}")
         
         # Find all PDF files
-        if recursive:
-            pdf_files = list(dir_path.rglob('*.pdf'))
-        else:
-            pdf_files = list(dir_path.glob('*.pdf'))
-        
-        pdf_paths = [str(f) for f in pdf_files]
-        
-        logger.info(f"Found {len(pdf_paths)} PDF files")
+        pdf_paths = discover_pdfs(directory, recursive)
         
         if not pdf_paths:
             logger.warning("No PDF files found in directory")
@@ -167,6 +319,107 @@ class PDFScanner:
             logger.error(f"Failed to save scan results: {e}")
 
 
+def _scan_pdf_tree(
+    root: str,
+    recursive: bool = True,
+    dir_mtimes: Optional[Dict[str, int]] = None
+) -> List[str]:
+    """
+    Walk a directory tree with os.scandir and collect PDF paths.
+    
+    DirEntry caches the file type from the directory listing, so each entry
+    costs a single syscall instead of the several made by Path.rglob.
+    
+    Args:
+        root: Directory to walk
+        recursive: Whether to descend into subdirectories
+        dir_mtimes: Optional dict filled with the mtime (ns) of every directory visited
+        
+    Returns:
+        List of PDF file paths
+    """
+    pdf_paths = []
+    stack = [root]
+    
+    while stack:
+        current = stack.pop()
+        try:
+            if dir_mtimes is not None:
+                dir_mtimes[current] = os.stat(current).st_mtime_ns
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                stack.append(entry.path)
+                        elif entry.name.lower().endswith('.pdf') and entry.is_file():
+                            pdf_paths.append(entry.path)
+                    except OSError as e:
+                        logger.debug(f"Skipping {entry.path}: {e}")
+        except OSError as e:
+            logger.warning(f"Cannot read directory {current}: {e}")
+    
+    return pdf_paths
+
+
+class PDFListingCache:
+    """
+    In-process LRU cache of folder PDF listings.
+    
+    A listing stays valid while the mtime of every directory in the tree is
+    unchanged (adding, removing or renaming an entry updates its parent's
+    mtime), so re-selecting a folder costs one stat per directory instead of
+    a full walk.
+    """
+    
+    def __init__(self, max_entries: int = 16):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, bool], Tuple[Dict[str, int], List[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def discover(self, folder: str, recursive: bool = True) -> List[str]:
+        """
+        Discover PDFs in a folder, reusing the cached listing if still valid.
+        
+        Args:
+            folder: Directory path
+            recursive: Whether to scan subdirectories
+            
+        Returns:
+            List of PDF file paths
+        """
+        key = (folder, recursive)
+        with self._lock:
+            entry = self._entries.get(key)
+        
+        if entry is not None and self._is_fresh(entry[0]):
+            with self._lock:
+                self._entries.move_to_end(key)
+            logger.info(f"Using cached PDF listing for {folder} ({len(entry[1])} files)")
+            return list(entry[1])
+        
+        logger.info(f"Discovering PDFs in: {folder}")
+        dir_mtimes: Dict[str, int] = {}
+        pdf_paths = _scan_pdf_tree(folder, recursive, dir_mtimes)
+        logger.info(f"Found {len(pdf_paths)} PDF files")
+        
+        with self._lock:
+            self._entries[key] = (dir_mtimes, pdf_paths)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        
+        return list(pdf_paths)
+    
+    @staticmethod
+    def _is_fresh(dir_mtimes: Dict[str, int]) -> bool:
+        """Check that no directory in a cached tree changed"""
+        try:
+            return all(os.stat(d).st_mtime_ns == mtime for d, mtime in dir_mtimes.items())
+        except OSError:
+            return False
+
+
 def discover_pdfs(path: str, recursive: bool = True) -> List[str]:
     """
     Discover all PDF files in a path.
@@ -191,12 +444,7 @@ def discover_pdfs(path: str, recursive: bool = True) -> List[str]:
     elif path_obj.is_dir():
         logger.info(f"Discovering PDFs in: {path_obj}")
         
-        if recursive:
-            pdfs = list(path_obj.rglob('*.pdf'))
-        else:
-            pdfs = list(path_obj.glob('*.pdf'))
-        
-        pdf_paths = [str(f) for f in pdfs]
+        pdf_paths = _scan_pdf_tree(path, recursive)
         logger.info(f"Found {len(pdf_paths)} PDF files")
         
         return pdf_paths
@@ -2,6 +2,7 @@
 Report generator service
 Generates HTML and Excel reports from scan results
 """
+import os
 from pathlib import Path
 from typing import List
 from datetime import datetime
@@ -392,7 +393,7 @@ def generate_html_report(job: ScanJob, output_path: str = None) -> str:
         
         # Determine output path
         if not output_path:
-            output_path = config.REPORTS_FOLDER / f"{job.job_id}.html"
+            output_path = os.fspath(config.REPORTS_FOLDER / f"{job.job_id}.html")
         
         # Write HTML file
         with open(output_path, 'w', encoding='utf-8') as f:
@@ -522,7 +523,7 @@ def generate_excel_report(job: ScanJob, output_path: str = None) -> str:
         
         # Determine output path
         if not output_path:
-            output_path = config.REPORTS_FOLDER / f"{job.job_id}.xlsx"
+            output_path = os.fspath(config.REPORTS_FOLDER / f"{job.job_id}.xlsx")
         
         # Save workbook
         wb.save(output_path)
@@ -0,0 +1,158 @@
+"""
+Scan result cache
+Skips re-validating PDFs whose content has not changed since the last scan
+"""
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Any
+
+from utils.logger import setup_logger
+from models.scan_result import PDFResult
+import config
+
+logger = setup_logger(__name__)
+
+HASH_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
+def sha256_file(filepath: str) -> str:
+    """
+    Compute the SHA-256 hex digest of a file, streaming it in chunks.
+
+    Args:
+        filepath: Path to the file
+
+    Returns:
+        Hex digest string
+    """
+    h = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+class ScanCache:
+    """
+    Persistent cache of PDF results keyed by file content hash.
+
+    Entries are only valid for the veraPDF flavour (and version, when known)
+    they were produced with; the whole cache is dropped if either changes.
+    The file is read on first use (on the scan thread, not at startup) and
+    holds at most max_entries results, least recently used dropped first.
+    """
+
+    def __init__(
+        self,
+        cache_file: Optional[str] = None,
+        flavour: Optional[str] = None,
+        verapdf_version: str = "",
+        max_entries: Optional[int] = None
+    ):
+        self.cache_file = cache_file or str(config.SCAN_CACHE_FILE)
+        self.flavour = flavour or config.VERAPDF_FLAVOUR
+        self.verapdf_version = verapdf_version
+        self.max_entries = max_entries or config.SCAN_CACHE_MAX_ENTRIES
+        # sha256 -> result dict, least recently used first
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._loaded = False
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _ensure_loaded(self):
+        """Load the cache file on first use (call with _lock held)"""
+        if not self._loaded:
+            self._loaded = True
+            self._load()
+
+    def _load(self):
+        """Load cache entries from disk"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable scan cache {self.cache_file}: {e}")
+            return
+
+        if (data.get('flavour') != self.flavour
+                or data.get('verapdf_version', '') != self.verapdf_version):
+            logger.info("Scan cache invalidated (veraPDF flavour or version changed)")
+            self._dirty = True
+            return
+
+        # JSON keeps insertion order, so the file is already least recently used first
+        self._entries = OrderedDict(data.get('entries', {}))
+        self._evict()
+        logger.info(f"Loaded {len(self._entries)} cached scan results")
+
+    def _evict(self):
+        """Drop least recently used entries beyond max_entries (call with _lock held)"""
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._dirty = True
+
+    def get(self, sha256: str, filepath: str) -> Optional[PDFResult]:
+        """
+        Look up a cached result for a file hash.
+
+        Args:
+            sha256: Content hash of the file
+            filepath: Current path of the file (identical content may move)
+
+        Returns:
+            PDFResult rebound to filepath, or None on a cache miss
+        """
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(sha256)
+            if entry is None:
+                return None
+            # Recency alone does not mark the cache dirty; it is written with the next change
+            self._entries.move_to_end(sha256)
+
+        result = PDFResult.from_dict(entry)
+        result.filepath = filepath
+        result.filename = os.path.basename(filepath)
+        return result
+
+    def put(self, sha256: str, result: PDFResult):
+        """Store a result; results with errors are not cached"""
+        if result.error:
+            return
+        with self._lock:
+            self._ensure_loaded()
+            self._entries[sha256] = result.to_dict()
+            self._entries.move_to_end(sha256)
+            self._evict()
+            self._dirty = True
+
+    def save(self):
+        """Write the cache to disk if it changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+            # Snapshot under the lock; get() and put() reorder the live dict
+            data = {
+                'flavour': self.flavour,
+                'verapdf_version': self.verapdf_version,
+                'entries': dict(self._entries),
+            }
+            self._dirty = False
+
+        # Write a temp file and swap it in so a crash mid-write keeps the old cache
+        tmp_file = self.cache_file + '.tmp'
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_file, self.cache_file)
+            logger.debug(f"Saved scan cache: {self.cache_file}")
+        except Exception as e:
+            logger.error(f"Failed to save scan cache: {e}")
+            # Keep the changes so the next save retries them
+            with self._lock:
+                self._dirty = True
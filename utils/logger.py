@@ -6,6 +6,18 @@ import logging.handlers
 from pathlib import Path
 import config
 
+SEPARATOR = "=" * 80  # Line used by log_separator
+
+
+def _create_file_handler() -> logging.Handler:
+    """Create the rotating log file handler"""
+    return logging.handlers.RotatingFileHandler(
+        config.LOG_FILE,
+        maxBytes=config.LOG_MAX_BYTES,
+        backupCount=config.LOG_BACKUP_COUNT,
+        encoding='utf-8'
+    )
+
 
 def setup_logger(name: str = __name__) -> logging.Logger:
     """
@@ -29,12 +41,12 @@ def setup_logger(name: str = __name__) -> logging.Logger:
     formatter = logging.Formatter(config.LOG_FORMAT)
     
     # File handler with rotation
-    file_handler = logging.handlers.RotatingFileHandler(
-        config.LOG_FILE,
-        maxBytes=config.LOG_MAX_BYTES,
-        backupCount=config.LOG_BACKUP_COUNT,
-        encoding='utf-8'
-    )
+    try:
+        file_handler = _create_file_handler()
+    except FileNotFoundError:
+        # Logs folder not created yet (config no longer creates it on import)
+        config.LOGS_FOLDER.mkdir(parents=True, exist_ok=True)
+        file_handler = _create_file_handler()
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(formatter)
     
@@ -58,13 +70,12 @@ def log_separator(logger: logging.Logger, message: str = ""):
         logger: Logger instance
         message: Optional message to include in separator
     """
-    sep = "=" * 80
     if message:
-        logger.info(sep)
+        logger.info(SEPARATOR)
         logger.info(f" {message}")
-        logger.info(sep)
+        logger.info(SEPARATOR)
     else:
-        logger.info(sep)
+        logger.info(SEPARATOR)
 
 
 # Create default logger for module-level use
@@ -3,10 +3,15 @@ Shared PDF utilities for consistent document handling
 """
 import fitz
 import logging
+import re
 from typing import Dict, List, Optional, Any
 
 logger = logging.getLogger(__name__)
 
+_OBJ_REF_RE = re.compile(r'(\d+)\s+0\s+R')
+_INT_RE = re.compile(r'\d+')
+_MCID_RE = re.compile(r'/MCID\s+(\d+)')
+
 def build_xref_page_map(doc: fitz.Document) -> Dict[int, int]:
     """
     Build a mapping of XREF IDs to Page Indices (0-based).
@@ -79,13 +84,8 @@ def resolve_violation_page(violation: Any, doc: fitz.Document, xref_map: Dict[in
         return violation.page
         
     # 2. Try Object ID lookup
-    if violation.object_id:
-        try:
-            xref = int(violation.object_id.split()[0])
-            if xref in xref_map:
-                return xref_map[xref]
-        except:
-            pass
+    if violation.xref is not None and violation.xref in xref_map:
+        return xref_map[violation.xref]
             
     # 3. Last resort: text search (only if we have document handle)
     # This is expensive and heuristic, might be better left to the UI
@@ -95,6 +95,8 @@ def resolve_violation_page(violation: Any, doc: fitz.Document, xref_map: Dict[in
 def get_logical_structure(doc: fitz.Document) -> List[Dict[str, Any]]:
     """
     Extract logical structure (Tags) from PDF manually using low-level XREF access.
+    The tree is walked with an explicit stack, so deeply nested tags cannot
+    exhaust the recursion limit.
     """
     try:
         cat_xref = doc.pdf_catalog()
@@ -104,43 +106,57 @@ def get_logical_structure(doc: fitz.Document) -> List[Dict[str, Any]]:
             return []
             
         root_xref = int(st_root_val[1].split()[0])
-        return _parse_kids(doc, root_xref)
+        page_index = {doc.page_xref(i): i for i in range(doc.page_count)}
+        
+        roots: List[Dict[str, Any]] = []
+        seen = {root_xref}  # Guards against reference cycles in malformed files
+        # (element whose K to expand, list its child nodes go into)
+        stack = [(root_xref, roots)]
+        while stack:
+            parent_xref, siblings = stack.pop()
+            try:
+                kid_xrefs = _kid_xrefs(doc, parent_xref)
+            except Exception as e:
+                if parent_xref == root_xref:
+                    raise
+                logger.debug(f"Error reading kids of struct elem {parent_xref}: {e}")
+                continue
+            
+            for xref in kid_xrefs:
+                if xref in seen:
+                    continue
+                seen.add(xref)
+                elem = _parse_struct_elem(doc, xref, page_index)
+                if elem:
+                    siblings.append(elem)
+                    stack.append((xref, elem["children"]))
+        return roots
     except Exception as e:
         logger.error(f"Error extracting manual structure: {e}")
         return []
 
-def _parse_kids(doc: fitz.Document, parent_xref: int) -> List[Dict[str, Any]]:
-    """Helper to parse the 'K' (Kids) key of a structure element or root"""
-    kids = []
+def _kid_xrefs(doc: fitz.Document, parent_xref: int) -> List[int]:
+    """Helper to read the structure element references in the 'K' (Kids) key of an element or root"""
     val = doc.xref_get_key(parent_xref, "K")
     
     # val is like ('xref', '123 0 R') or ('array', '[123 0 R 456 0 R]') or ('int', '5')
     if val[0] == 'xref':
-        elem = _parse_struct_elem(doc, int(val[1].split()[0]))
-        if elem: kids.append(elem)
-    elif val[0] == 'array':
-        import re
-        # Check if it's an array of integers (MCIDs) or object references
-        if 'R' not in val[1]:
-            # Likely MCIDs: [0 1 2 3]
-            mcids = [int(x) for x in re.findall(r'\d+', val[1])]
-            # For simpler UI, we treat MCIDs as children nodes if they are direct kids of root
-            # but usually MCIDs are kids of a StructElem.
-            # We'll return them as a special key in the parent instead of separate nodes.
-            pass
-        else:
-            xref_ids = re.findall(r'(\d+)\s+0\s+R', val[1])
-            for xid in xref_ids:
-                elem = _parse_struct_elem(doc, int(xid))
-                if elem: kids.append(elem)
-    elif val[0] == 'int':
-        # Single MCID
-        pass
+        return [int(val[1].split()[0])]
+    if val[0] == 'array' and 'R' in val[1]:
+        return [int(xid) for xid in _OBJ_REF_RE.findall(val[1])]
     
-    return kids
+    # Arrays of integers and single ints are MCIDs; they are read into the
+    # element's "mcids" key by _parse_struct_elem rather than becoming nodes
+    return []
 
-def _parse_struct_elem(doc: fitz.Document, xref: int) -> Optional[Dict[str, Any]]:
-    """Parse a single /StructElem object and its content items"""
+def _parse_struct_elem(doc: fitz.Document, xref: int, page_index: Dict[int, int]) -> Optional[Dict[str, Any]]:
+    """
+    Parse a single /StructElem object and its content items.
+    "children" is left empty for the caller to fill.
+    
+    Args:
+        page_index: Page object xref -> page index
+    """
     try:
         # Get Tag (Subtype)
         s_val = doc.xref_get_key(xref, "S")
@@ -155,11 +171,7 @@ def _parse_struct_elem(doc: fitz.Document, xref: int) -> Optional[Dict[str, Any]
         page_idx = -1
         if pg_val[0] == 'xref':
             pg_xref = int(pg_val[1].split()[0])
-            # Resolve page index from xref
-            for i in range(len(doc)):
-                if doc[i].xref == pg_xref:
-                    page_idx = i
-                    break
+            page_idx = page_index.get(pg_xref, -1)
         
         # Get MCIDs (Content items)
         mcids = []
@@ -167,25 +179,20 @@ def _parse_struct_elem(doc: fitz.Document, xref: int) -> Optional[Dict[str, Any]
         if k_val[0] == 'int':
             mcids.append(int(k_val[1]))
         elif k_val[0] == 'array' and 'R' not in k_val[1]:
-            import re
-            mcids.extend([int(x) for x in re.findall(r'\d+', k_val[1])])
+            mcids.extend([int(x) for x in _INT_RE.findall(k_val[1])])
         elif k_val[0] == 'dict' and '/MCID' in k_val[1]:
             # Some PDFs have dicts as kids
-            import re
-            mcid_match = re.search(r'/MCID\s+(\d+)', k_val[1])
+            mcid_match = _MCID_RE.search(k_val[1])
             if mcid_match:
                 mcids.append(int(mcid_match.group(1)))
 
-        # Recursively get children
-        children = _parse_kids(doc, xref)
-        
         return {
             "tag": tag,
             "title": title,
             "xref": xref,
             "page": page_idx,
             "mcids": mcids,
-            "children": children
+            "children": []
         }
     except Exception as e:
         logger.debug(f"Error parsing struct elem {xref}: {e}")
@@ -217,3 +224,28 @@ def map_mcids_to_rects(page: fitz.Page, mcids: List[int]) -> List[fitz.Rect]:
     
     return rects
 
+def map_xrefs_to_rects(page: fitz.Page) -> Dict[int, List[fitz.Rect]]:
+    """
+    Map xref -> rects for the images, annotations and widgets on a page.
+    One pass over the page, so callers can look up many violations by xref.
+    """
+    index = {}
+    try:
+        # A. Images
+        for img in page.get_images(full=True):
+            xref = img[0]
+            if xref not in index:
+                index[xref] = list(page.get_image_rects(xref))
+    except Exception as e:
+        logger.debug(f"Image lookup failed on page {page.number + 1}: {e}")
+    
+    try:
+        # B. Annotations & Widgets (Links, Form Fields, etc.)
+        for ann in page.annots():
+            index.setdefault(ann.xref, []).append(ann.rect)
+        for widget in page.widgets():
+            index.setdefault(widget.xref, []).append(widget.rect)
+    except Exception as e:
+        logger.debug(f"Annotation lookup failed on page {page.number + 1}: {e}")
+    
+    return index
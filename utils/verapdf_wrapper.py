@@ -5,7 +5,10 @@ Handles PDF validation through veraPDF command-line interface
 import subprocess
 import json
 import shutil
+import sys
+import threading
 import time
+import os
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from utils.logger import setup_logger, log_separator
@@ -24,14 +27,36 @@ class ValidationError(Exception):
     pass
 
 
-def find_verapdf_executable() -> Optional[str]:
+# Resolved veraPDF executable, cached after the first successful lookup
+_verapdf_executable: Optional[str] = None
+
+# veraPDF processes currently running, so they can be killed on shutdown
+_active_processes = set()
+_active_lock = threading.Lock()
+
+
+def find_verapdf_executable(refresh: bool = False) -> Optional[str]:
     """
     Find veraPDF executable on the system.
     Checks PATH and common installation locations.
+    The first successful result is cached for the rest of the process.
+    
+    Args:
+        refresh: Ignore the cached result and search again
     
     Returns:
         Path to veraPDF executable or None if not found
     """
+    global _verapdf_executable
+    if _verapdf_executable and not refresh:
+        return _verapdf_executable
+    
+    _verapdf_executable = _search_verapdf_executable()
+    return _verapdf_executable
+
+
+def _search_verapdf_executable() -> Optional[str]:
+    """Search PATH and common installation locations for veraPDF"""
     logger.info("Searching for veraPDF installation...")
     
     # Check if veraPDF is in PATH
@@ -62,6 +87,113 @@ def find_verapdf_executable() -> Optional[str]:
     return None
 
 
+def set_verapdf_executable(path: str):
+    """
+    Seed the executable cache with a previously resolved path,
+    skipping the PATH search on startup.
+    
+    Args:
+        path: veraPDF executable known to work
+    """
+    global _verapdf_executable
+    _verapdf_executable = path
+
+
+def get_verapdf_version(verapdf_exe: str) -> Optional[str]:
+    """
+    Get the installed veraPDF version string.
+    
+    Args:
+        verapdf_exe: veraPDF executable
+        
+    Returns:
+        First line of `verapdf --version` output, or None on failure
+    """
+    try:
+        result = subprocess.run(
+            [verapdf_exe, '--version'],
+            capture_output=True,
+            text=True,
+            timeout=60,
+            shell=True  # Required for .BAT files on Windows
+        )
+        output = (result.stdout or result.stderr).strip()
+        return output.splitlines()[0] if output else None
+    except Exception as e:
+        logger.warning(f"Could not determine veraPDF version: {e}")
+        return None
+
+
+def _build_command(verapdf_exe: str, flavour: str, include_success: bool = False) -> List[str]:
+    """Build the veraPDF command line, without the input files"""
+    cmd = [
+        verapdf_exe,
+        '--format', config.VERAPDF_OUTPUT_FORMAT,
+        '--flavour', flavour,
+        '--maxfailuresdisplayed', str(config.MAX_FAILURES_DISPLAYED),
+    ]
+    
+    if include_success:
+        cmd.append('--success')
+    
+    return cmd
+
+
+def _run_verapdf(cmd: List[str], timeout: float) -> subprocess.CompletedProcess:
+    """
+    Run veraPDF, tracking the process so it can be terminated on shutdown.
+    
+    Raises:
+        subprocess.TimeoutExpired: If veraPDF runs longer than timeout
+    """
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        shell=True  # Required for .BAT files on Windows
+    )
+    with _active_lock:
+        _active_processes.add(process)
+    
+    try:
+        stdout, stderr = process.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        _kill_process_tree(process)
+        process.communicate()
+        raise
+    finally:
+        with _active_lock:
+            _active_processes.discard(process)
+    
+    return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+
+
+def terminate_running_validations():
+    """Kill any veraPDF processes still running (used on application shutdown)"""
+    with _active_lock:
+        processes = list(_active_processes)
+    
+    for process in processes:
+        logger.info(f"Terminating veraPDF process {process.pid}")
+        _kill_process_tree(process)
+
+
+def _kill_process_tree(process: subprocess.Popen):
+    """Kill a veraPDF process including the JVM started by the shell/.bat wrapper"""
+    try:
+        if sys.platform == "win32":
+            subprocess.run(
+                ['taskkill', '/F', '/T', '/PID', str(process.pid)],
+                capture_output=True,
+                timeout=10
+            )
+        else:
+            process.kill()
+    except Exception as e:
+        logger.debug(f"Could not kill process {process.pid}: {e}")
+
+
 def validate_pdf(
     pdf_path: str,
     flavour: str = None,
@@ -98,16 +230,7 @@ def validate_pdf(
         )
     
     # Build command
-    cmd = [
-        verapdf_exe,
-        '--format', config.VERAPDF_OUTPUT_FORMAT,
-        '--flavour', flavour,
-        '--maxfailuresdisplayed', str(config.MAX_FAILURES_DISPLAYED),
-    ]
-    
-    if include_success:
-        cmd.append('--success')
-    
+    cmd = _build_command(verapdf_exe, flavour, include_success)
     cmd.append(str(pdf_path))
     
     logger.info(f"Executing command: {' '.join(cmd)}")
@@ -116,13 +239,7 @@ def validate_pdf(
     start_time = time.time()
     
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=config.SCAN_TIMEOUT,
-            shell=True  # Required for .BAT files on Windows
-        )
+        result = _run_verapdf(cmd, config.SCAN_TIMEOUT)
         
         end_time = time.time()
         duration = end_time - start_time
@@ -226,7 +343,43 @@ def parse_validation_output(json_data: Dict, filename: str) -> Dict[str, Any]:
                 'error': 'No validation data'
             }
         
-        job = jobs[0]
+        return parse_job_output(jobs[0], filename)
+        
+    except Exception as e:
+        logger.error(f"Error parsing validation output: {e}", exc_info=True)
+        return {
+            'filename': filename,
+            'compliant': False,
+            'profile': 'Error',
+            'violations': [],
+            'error': str(e)
+        }
+
+
+def parse_job_output(job: Dict, filename: str) -> Dict[str, Any]:
+    """
+    Parse a single job entry of veraPDF JSON output.
+    
+    Args:
+        job: One element of report.jobs
+        filename: Name of the PDF file
+        
+    Returns:
+        Parsed validation results
+    """
+    try:
+        # A file veraPDF could not process (e.g. encrypted or corrupt)
+        task_exception = job.get('taskException')
+        if task_exception and not job.get('validationResult'):
+            message = task_exception.get('exceptionMessage', 'veraPDF task failed') if isinstance(task_exception, dict) else str(task_exception)
+            logger.warning(f"veraPDF could not process {filename}: {message}")
+            return {
+                'filename': filename,
+                'compliant': False,
+                'profile': 'Error',
+                'violations': [],
+                'error': message
+            }
         
         # veraPDF returns 'validationResult' as an array, not 'validationReport'
         validation_results = job.get('validationResult', [])
@@ -355,6 +508,103 @@ def parse_validation_output(json_data: Dict, filename: str) -> Dict[str, Any]:
         }
 
 
+def validate_pdf_batch(
+    pdf_paths: List[str],
+    flavour: str = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Validate several PDF files with a single veraPDF invocation,
+    paying the JVM startup cost once for the whole batch.
+    
+    Args:
+        pdf_paths: Paths to PDF files to validate
+        flavour: PDF standard to validate against (default: from config)
+        
+    Returns:
+        Dictionary mapping each input path to its parsed validation result
+        
+    Raises:
+        VeraPDFNotFoundError: If veraPDF is not found
+        ValidationError: If the batch as a whole fails
+    """
+    flavour = flavour or config.VERAPDF_FLAVOUR
+    
+    log_separator(logger, f"Validating batch of {len(pdf_paths)} PDFs")
+    logger.info(f"Standard: PDF/{flavour.upper()}")
+    
+    verapdf_exe = find_verapdf_executable()
+    if not verapdf_exe:
+        raise VeraPDFNotFoundError(
+            "veraPDF not found. Please install veraPDF and ensure it's in your PATH."
+        )
+    
+    cmd = _build_command(verapdf_exe, flavour)
+    cmd.extend(str(p) for p in pdf_paths)
+    
+    logger.debug(f"Executing command: {' '.join(cmd)}")
+    
+    start_time = time.time()
+    
+    try:
+        result = _run_verapdf(cmd, config.SCAN_TIMEOUT * len(pdf_paths))
+    except subprocess.TimeoutExpired:
+        logger.error("✗ Batch validation timed out")
+        raise ValidationError(f"Batch validation timed out after {config.SCAN_TIMEOUT * len(pdf_paths)}s")
+    except Exception as e:
+        logger.error(f"✗ Unexpected error during batch validation: {e}", exc_info=True)
+        raise ValidationError(f"Validation error: {e}")
+    
+    logger.info(f"✓ veraPDF completed batch in {time.time() - start_time:.2f} seconds")
+    logger.info(f"Exit code: {result.returncode}")
+    
+    if result.stderr:
+        logger.warning(f"STDERR: {result.stderr}")
+    
+    # Exit code 1 means non-compliant PDFs, not an error
+    if result.returncode not in (0, 1):
+        raise ValidationError(f"veraPDF failed: {result.stderr}")
+    
+    if not result.stdout or not result.stdout.strip():
+        raise ValidationError("veraPDF produced no output")
+    
+    try:
+        output_data = json.loads(result.stdout)
+    except json.JSONDecodeError as e:
+        logger.debug(f"Raw output: {result.stdout}")
+        raise ValidationError(f"Invalid JSON output from veraPDF: {e}")
+    
+    # veraPDF reports each file as its own job; match jobs back to inputs by path
+    by_path = {os.path.normcase(os.path.abspath(p)): p for p in pdf_paths}
+    by_name = {os.path.basename(p): p for p in pdf_paths}
+    
+    results = {}
+    for job in output_data.get('report', {}).get('jobs', []):
+        item_name = job.get('itemDetails', {}).get('name', '')
+        pdf_path = by_path.get(os.path.normcase(os.path.abspath(item_name))) if item_name else None
+        if pdf_path is None:
+            pdf_path = by_name.get(os.path.basename(item_name))
+        if pdf_path is None:
+            logger.warning(f"Ignoring veraPDF job for unknown item: {item_name}")
+            continue
+        
+        results[pdf_path] = parse_job_output(job, os.path.basename(pdf_path))
+    
+    missing = [p for p in pdf_paths if p not in results]
+    if missing:
+        logger.warning(f"veraPDF returned no result for {len(missing)} file(s)")
+        for p in missing:
+            results[p] = {
+                'filename': os.path.basename(p),
+                'compliant': False,
+                'profile': 'Error',
+                'violations': [],
+                'error': 'No validation data'
+            }
+    
+    logger.info(f"✓ Parsed batch results for {len(results)} PDFs")
+    return results
+
+
 def validate_multiple_pdfs(
     pdf_paths: List[str],
     flavour: str = None,